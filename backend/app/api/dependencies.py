@@ -0,0 +1,13 @@
+"""
+Shared FastAPI dependencies
+"""
+
+from functools import lru_cache
+
+from app.services.openstack import OpenStackClient
+
+
+@lru_cache(maxsize=1)
+def get_openstack_client() -> OpenStackClient:
+    """Return the process-wide OpenStack client, connecting on first use"""
+    return OpenStackClient()
@@ -2,12 +2,16 @@
 Alerts API endpoints
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi_cache.decorator import cache
+import orjson
 from pydantic import BaseModel
 from datetime import datetime
 from enum import Enum
 
+from ..responses import json_bytes_response, make_etag
+
 router = APIRouter()
 
 
@@ -37,122 +41,117 @@ class Alert(BaseModel):
     updated_at: Optional[datetime] = None
 
 
+# Sample alerts data, built once at import time with a frozen timestamp
+_SAMPLE_CREATED_AT = datetime.now()
+
+_SAMPLE_ALERTS: List[Alert] = [
+    Alert(
+        id="1",
+        title="High CPU Usage",
+        message="Instance cirros-test-1 CPU usage is above 80%",
+        severity=AlertSeverity.WARNING,
+        status=AlertStatus.ACTIVE,
+        source="instance:cirros-test-1",
+        created_at=_SAMPLE_CREATED_AT
+    ),
+    Alert(
+        id="2",
+        title="Service Down",
+        message="Swift object storage service is not responding",
+        severity=AlertSeverity.CRITICAL,
+        status=AlertStatus.ACTIVE,
+        source="service:swift",
+        created_at=_SAMPLE_CREATED_AT
+    ),
+    Alert(
+        id="3",
+        title="New Instance Created",
+        message="Instance ubuntu-server-1 has been created successfully",
+        severity=AlertSeverity.INFO,
+        status=AlertStatus.RESOLVED,
+        source="instance:ubuntu-server-1",
+        created_at=_SAMPLE_CREATED_AT
+    )
+]
+
+# Pre-serialized payload for the unfiltered list
+_SAMPLE_ALERTS_JSON = orjson.dumps([a.model_dump(mode="json") for a in _SAMPLE_ALERTS])
+_SAMPLE_ALERTS_ETAG = make_etag(_SAMPLE_ALERTS_JSON)
+
+# Filter indexes so lookups don't scan the whole alert list
+_BY_SEVERITY: Dict[AlertSeverity, List[Alert]] = {severity: [] for severity in AlertSeverity}
+_BY_STATUS: Dict[AlertStatus, List[Alert]] = {status: [] for status in AlertStatus}
+_BY_SEV_STATUS: Dict[Tuple[AlertSeverity, AlertStatus], List[Alert]] = {
+    (severity, status): [] for severity in AlertSeverity for status in AlertStatus
+}
+for _alert in _SAMPLE_ALERTS:
+    _BY_SEVERITY[_alert.severity].append(_alert)
+    _BY_STATUS[_alert.status].append(_alert)
+    _BY_SEV_STATUS[(_alert.severity, _alert.status)].append(_alert)
+
+
 @router.get("/", response_model=List[Alert])
 async def get_alerts(
+    request: Request,
     severity: Optional[AlertSeverity] = Query(None, description="Filter by severity"),
     status: Optional[AlertStatus] = Query(None, description="Filter by status"),
     limit: int = Query(50, description="Maximum number of alerts")
 ):
     """Get alerts with optional filtering"""
-    try:
-        # Sample alerts data
-        sample_alerts = [
-            Alert(
-                id="1",
-                title="High CPU Usage",
-                message="Instance cirros-test-1 CPU usage is above 80%",
-                severity=AlertSeverity.WARNING,
-                status=AlertStatus.ACTIVE,
-                source="instance:cirros-test-1",
-                created_at=datetime.now()
-            ),
-            Alert(
-                id="2",
-                title="Service Down",
-                message="Swift object storage service is not responding",
-                severity=AlertSeverity.CRITICAL,
-                status=AlertStatus.ACTIVE,
-                source="service:swift",
-                created_at=datetime.now()
-            ),
-            Alert(
-                id="3",
-                title="New Instance Created",
-                message="Instance ubuntu-server-1 has been created successfully",
-                severity=AlertSeverity.INFO,
-                status=AlertStatus.RESOLVED,
-                source="instance:ubuntu-server-1",
-                created_at=datetime.now()
-            )
-        ]
-        
-        alerts = sample_alerts
-        
-        # Apply filters
-        if severity:
-            alerts = [a for a in alerts if a.severity == severity]
-        
-        if status:
-            alerts = [a for a in alerts if a.status == status]
-        
-        return alerts[:limit]
+    if severity is None and status is None:
+        if limit >= len(_SAMPLE_ALERTS):
+            return json_bytes_response(_SAMPLE_ALERTS_JSON, request, _SAMPLE_ALERTS_ETAG)
+        alerts = _SAMPLE_ALERTS
+    # Apply filters
+    elif severity and status:
+        alerts = _BY_SEV_STATUS[(severity, status)]
+    elif severity:
+        alerts = _BY_SEVERITY[severity]
+    else:
+        alerts = _BY_STATUS[status]
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return json_bytes_response(orjson.dumps([a.model_dump() for a in alerts[:limit]]), request)
 
 
 @router.get("/{alert_id}", response_model=Alert)
 async def get_alert(alert_id: str):
     """Get specific alert details"""
-    try:
-        # Sample alert lookup
-        if alert_id == "1":
-            return Alert(
-                id="1",
-                title="High CPU Usage",
-                message="Instance cirros-test-1 CPU usage is above 80%",
-                severity=AlertSeverity.WARNING,
-                status=AlertStatus.ACTIVE,
-                source="instance:cirros-test-1",
-                created_at=datetime.now()
-            )
-        
-        raise HTTPException(status_code=404, detail="Alert not found")
+    # Sample alert lookup
+    if alert_id == "1":
+        return _SAMPLE_ALERTS[0]
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    raise HTTPException(status_code=404, detail="Alert not found")
 
 
 @router.post("/{alert_id}/acknowledge")
 async def acknowledge_alert(alert_id: str):
     """Acknowledge an alert"""
-    try:
-        return {
-            "alert_id": alert_id,
-            "status": "acknowledged",
-            "acknowledged_at": datetime.now()
-        }
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "alert_id": alert_id,
+        "status": "acknowledged",
+        "acknowledged_at": datetime.now()
+    }
 
 
 @router.post("/{alert_id}/resolve")
 async def resolve_alert(alert_id: str):
     """Resolve an alert"""
-    try:
-        return {
-            "alert_id": alert_id,
-            "status": "resolved",
-            "resolved_at": datetime.now()
-        }
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "alert_id": alert_id,
+        "status": "resolved",
+        "resolved_at": datetime.now()
+    }
 
 
 @router.get("/stats/summary")
+@cache(expire=60, namespace="alerts")
 async def get_alerts_summary():
     """Get alerts summary statistics"""
-    try:
-        return {
-            "total": 15,
-            "active": 3,
-            "critical": 1,
-            "warning": 2,
-            "info": 0,
-            "resolved_today": 5
-        }
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    return {
+        "total": 15,
+        "active": 3,
+        "critical": 1,
+        "warning": 2,
+        "info": 0,
+        "resolved_today": 5
+    }
\ No newline at end of file
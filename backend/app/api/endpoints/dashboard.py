@@ -0,0 +1,63 @@
+"""
+Dashboard API endpoint
+"""
+
+import asyncio
+import logging
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_openstack_client
+from app.api.responses import OrjsonResponse
+from app.api.endpoints.metrics import build_metrics_summary
+from app.core.cache import cached_or_refresh
+from app.core.config import settings
+from app.services.openstack import OpenStackClient
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("")
+async def get_dashboard(openstack_client: OpenStackClient = Depends(get_openstack_client)):
+    """
+    Get everything the dashboard page shows in a single response
+    
+    Combines /instances, /services, /system/uptime and /metrics/summary so the
+    dashboard makes one request per refresh and OpenStack is queried once.
+    """
+    instances, services, uptime = await asyncio.gather(
+        cached_or_refresh(
+            "instances:None",
+            openstack_client.get_instances,
+            ttl=settings.OPENSTACK_CACHE_TTL,
+            stale_ttl=settings.OPENSTACK_STALE_TTL
+        ),
+        cached_or_refresh(
+            "services:all",
+            openstack_client.get_services,
+            ttl=settings.OPENSTACK_CACHE_TTL,
+            stale_ttl=settings.OPENSTACK_STALE_TTL
+        ),
+        openstack_client.get_system_uptime(),
+        return_exceptions=True
+    )
+    
+    # Instances and services are required, as they are for their own endpoints
+    for result in (instances, services):
+        if isinstance(result, Exception):
+            raise result
+    (instances, instances_stale), (services, services_stale) = instances, services
+    headers = {"X-Cache": "stale"} if instances_stale or services_stale else None
+    
+    if isinstance(uptime, Exception):
+        logger.warning(f"Could not get system uptime: {uptime}")
+        uptime = None
+    
+    return OrjsonResponse(content={
+        # Don't show instances if no real OpenStack connection
+        "instances": [i.model_dump() for i in instances] if openstack_client.connection else [],
+        "services": [s.model_dump() for s in services],
+        "uptime": uptime,
+        "metrics": build_metrics_summary(instances, services)
+    }, headers=headers)
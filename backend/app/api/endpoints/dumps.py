@@ -2,27 +2,32 @@
 Memory dump API endpoints for digital forensics
 """
 
+import asyncio
 import logging
+import os
 from typing import List
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi_cache.decorator import cache
+from pydantic import BaseModel, TypeAdapter
 
+from ...core.cache import invalidate_cache
+from ..responses import LargeFileResponse, OrjsonResponse
 from ...models.dump import DumpRequest, DumpResponse, MemoryDump, DumpStatus
+from ...services.forensic_analysis import forensic_service
 from ...services.memory_dump import memory_dump_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Compiled list serializer for the dumps list endpoint
+_DUMP_LIST_ADAPTER = TypeAdapter(List[MemoryDump])
+
 
 @router.get("", response_model=List[MemoryDump])
 async def get_all_dumps():
     """Get all memory dumps"""
-    try:
-        dumps = memory_dump_service.get_all_dumps()
-        return dumps
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get dumps: {str(e)}")
+    dumps = memory_dump_service.get_all_dumps()
+    return Response(content=_DUMP_LIST_ADAPTER.dump_json(dumps), media_type="application/json")
 
 
 class DumpStats(BaseModel):
@@ -35,105 +40,58 @@ class DumpStats(BaseModel):
 
 
 @router.get("/stats", response_model=DumpStats)
+@cache(expire=30, namespace="dumps")
 async def get_dump_stats():
     """Get memory dump statistics"""
-    try:
-        logger.info("Getting dump statistics...")
-        dumps = memory_dump_service.get_all_dumps()
-        logger.info(f"Found {len(dumps)} dumps")
-        
-        if not dumps:
-            logger.info("No dumps found, returning empty stats")
-            return DumpStats(
-                total_dumps=0,
-                completed_dumps=0,
-                failed_dumps=0,
-                in_progress_dumps=0,
-                total_size_gb=0.0
-            )
-        
-        # Debug dump statuses
-        for i, dump in enumerate(dumps):
-            logger.info(f"Dump {i}: status={dump.status}, type={type(dump.status)}")
-        
-        total_dumps = len(dumps)
-        completed_dumps = len([d for d in dumps if d.status == DumpStatus.COMPLETED])
-        failed_dumps = len([d for d in dumps if d.status == DumpStatus.FAILED])
-        in_progress_dumps = len([d for d in dumps if d.status == DumpStatus.IN_PROGRESS])
-        
-        logger.info(f"Stats: total={total_dumps}, completed={completed_dumps}, failed={failed_dumps}, in_progress={in_progress_dumps}")
-        
-        total_size_bytes = sum([d.file_size or 0 for d in dumps if d.file_size])
-        total_size_gb = round(total_size_bytes / (1024**3), 2)
-        
-        logger.info(f"Total size: {total_size_bytes} bytes = {total_size_gb} GB")
-        
-        result = DumpStats(
-            total_dumps=total_dumps,
-            completed_dumps=completed_dumps,
-            failed_dumps=failed_dumps,
-            in_progress_dumps=in_progress_dumps,
-            total_size_gb=total_size_gb
-        )
-        
-        logger.info(f"Returning stats: {result}")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Error getting dump stats: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to get dump statistics: {str(e)}")
+    result = DumpStats(**memory_dump_service.get_stats())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Returning dump stats: %s", result)
+    return result
 
 
 @router.get("/{dump_id}", response_model=MemoryDump)
 async def get_dump(dump_id: str):
     """Get specific memory dump"""
-    try:
-        dump = memory_dump_service.get_dump(dump_id)
-        if not dump:
-            raise HTTPException(status_code=404, detail="Dump not found")
-        return dump
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get dump: {str(e)}")
+    dump = memory_dump_service.get_dump(dump_id)
+    if not dump:
+        raise HTTPException(status_code=404, detail="Dump not found")
+    # Stored dumps are already validated models, skip the response_model pass
+    return OrjsonResponse(content=dump.model_dump())
 
 
 @router.get("/{dump_id}/download")
 async def download_dump(dump_id: str):
     """Download memory dump file"""
-    try:
-        file_path = memory_dump_service.get_dump_file_path(dump_id)
-        if not file_path:
-            raise HTTPException(status_code=404, detail="Dump file not found or not ready")
-        
-        dump = memory_dump_service.get_dump(dump_id)
-        filename = f"{dump.instance_name}_{dump_id}.dump"
-        
-        return FileResponse(
-            path=file_path,
-            filename=filename,
-            media_type='application/octet-stream'
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to download dump: {str(e)}")
+    file_path = memory_dump_service.get_dump_file_path(dump_id)
+    if not file_path:
+        raise HTTPException(status_code=404, detail="Dump file not found or not ready")
+    
+    dump = memory_dump_service.get_dump(dump_id)
+    filename = f"{dump.instance_name}_{dump_id}.dump"
+    
+    return LargeFileResponse(
+        path=file_path,
+        filename=filename,
+        media_type='application/octet-stream'
+    )
 
 
 @router.delete("/{dump_id}")
 async def delete_dump(dump_id: str):
     """Delete memory dump and file"""
+    dump = memory_dump_service.get_dump(dump_id)
+    if not dump:
+        raise HTTPException(status_code=404, detail="Dump not found")
+    
+    # Delete file if exists, off the event loop since unlinking a large dump can block
     try:
-        dump = memory_dump_service.get_dump(dump_id)
-        if not dump:
-            raise HTTPException(status_code=404, detail="Dump not found")
-        
-        # Delete file if exists
-        import os
-        if os.path.exists(dump.file_path):
-            os.remove(dump.file_path)
-        
-        # Remove from database
-        del memory_dump_service.dumps_db[dump_id]
-        
-        return {"message": f"Dump {dump_id} deleted successfully"}
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to delete dump: {str(e)}")
+        await asyncio.to_thread(os.unlink, dump.file_path)
+    except FileNotFoundError:
+        pass
+    
+    # Remove from database
+    memory_dump_service.remove_dump(dump_id)
+    forensic_service.forget_dump(dump_id)
+    await invalidate_cache("dumps")
+    
+    return {"message": f"Dump {dump_id} deleted successfully"}
@@ -3,10 +3,15 @@ Instances API endpoints
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, TypeAdapter
 
+from app.api.dependencies import get_openstack_client
+from app.api.responses import RawJSONResponse, SerializedListCache
+from app.core.cache import cached_or_refresh, invalidate_cache
+from app.core.config import settings
 from app.services.openstack import OpenStackClient
+from app.services.system_metrics import system_metrics_sampler
 from app.models.instance import Instance, InstanceStatus
 from app.models.dump import DumpRequest, DumpRequestBody, DumpResponse
 from app.services.memory_dump import memory_dump_service
@@ -29,42 +34,53 @@ class InstanceResponse(BaseModel):
     created_at: str
 
 
+# Encoded instance lists, reused while the cached OpenStack listing is unchanged
+_instance_lists = SerializedListCache(
+    TypeAdapter(List[Instance]), include=set(InstanceResponse.model_fields)
+)
+
+
 @router.get("", response_model=List[InstanceResponse])
 async def get_instances(
     status: Optional[InstanceStatus] = Query(None, description="Filter by status"),
-    search: Optional[str] = Query(None, description="Search by name or image")
+    search: Optional[str] = Query(None, description="Search by name or image"),
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
 ):
     """Get all instances with optional filtering"""
     try:
-        openstack_client = OpenStackClient()
-        instances = await openstack_client.get_instances()
-        
         # Don't show instances if no real OpenStack connection
         if not openstack_client.connection:
             return []
         
-        # Apply filters
-        if status:
-            instances = [i for i in instances if i.status == status]
+        # Status is filtered by OpenStack; name/image substring search has no Nova equivalent
+        instances, stale = await cached_or_refresh(
+            f"instances:{status}",
+            lambda: openstack_client.get_instances(status=status),
+            ttl=settings.OPENSTACK_CACHE_TTL,
+            stale_ttl=settings.OPENSTACK_STALE_TTL
+        )
+        headers = {"X-Cache": "stale"} if stale else None
         
-        if search:
-            search_lower = search.lower()
-            instances = [
-                i for i in instances 
-                if search_lower in i.name.lower() or search_lower in i.image.lower()
-            ]
+        def build():
+            if search:
+                search_lower = search.lower()
+                return [i for i in instances if search_lower in i.search_text]
+            return instances
         
-        return instances
+        body = _instance_lists.get((status, search), instances, build)
+        return RawJSONResponse(content=body, headers=headers)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{instance_id}", response_model=InstanceResponse)
-async def get_instance(instance_id: str):
+async def get_instance(
+    instance_id: str,
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
+):
     """Get specific instance details"""
     try:
-        openstack_client = OpenStackClient()
         instance = await openstack_client.get_instance(instance_id)
         
         if not instance:
@@ -77,16 +93,20 @@ async def get_instance(instance_id: str):
 
 
 @router.post("/{instance_id}/health-check")
-async def check_instance_health(instance_id: str):
+async def check_instance_health(
+    instance_id: str,
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
+):
     """Force health check for specific instance"""
     try:
-        openstack_client = OpenStackClient()
         health_status = await openstack_client.check_instance_health(instance_id)
+        await invalidate_cache("instances")
+        await invalidate_cache("dashboard")
         
         return {
             "instance_id": instance_id,
             "health_status": health_status,
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": system_metrics_sampler.get_timestamp()
         }
     
     except Exception as e:
@@ -94,10 +114,12 @@ async def check_instance_health(instance_id: str):
 
 
 @router.get("/{instance_id}/metrics")
-async def get_instance_metrics(instance_id: str):
+async def get_instance_metrics(
+    instance_id: str,
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
+):
     """Get instance performance metrics"""
     try:
-        openstack_client = OpenStackClient()
         metrics = await openstack_client.get_instance_metrics(instance_id)
         
         return metrics
@@ -107,49 +129,48 @@ async def get_instance_metrics(instance_id: str):
 
 
 @router.post("/{instance_id}/dump", response_model=DumpResponse)
-async def create_memory_dump(instance_id: str, request_body: DumpRequestBody):
+async def create_memory_dump(
+    instance_id: str,
+    request_body: DumpRequestBody,
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
+):
     """Create a memory dump for a specific instance"""
     try:
         # Get instance data from OpenStack
-        openstack_client = OpenStackClient()
-        instances = await openstack_client.get_instances()
-        instance_data = None
-        
-        for instance in instances:
-            if instance.id == instance_id:
-                # Convert OpenStack objects to dictionaries properly
-                addresses_dict = {}
-                if hasattr(instance, 'addresses') and instance.addresses:
-                    addresses_dict = dict(instance.addresses)
-                
-                image_dict = {}
-                if hasattr(instance, 'image') and instance.image:
-                    if isinstance(instance.image, dict):
-                        image_dict = instance.image
-                    else:
-                        image_dict = {'id': str(instance.image)}
-                
-                flavor_dict = {}
-                if hasattr(instance, 'flavor') and instance.flavor:
-                    if isinstance(instance.flavor, dict):
-                        flavor_dict = instance.flavor
-                    else:
-                        flavor_dict = {'id': str(instance.flavor)}
-                
-                instance_data = {
-                    'id': instance.id,
-                    'name': instance.name,
-                    'status': instance.status,
-                    'ip_address': instance.ip_address,  # Use the IP from the instance directly
-                    'addresses': addresses_dict,
-                    'image': image_dict,
-                    'flavor': flavor_dict
-                }
-                break
-        
-        if not instance_data:
+        instance = await openstack_client.get_instance(instance_id)
+        
+        if not instance:
             raise HTTPException(status_code=404, detail="Instance not found")
         
+        # Convert OpenStack objects to dictionaries properly
+        addresses_dict = {}
+        if hasattr(instance, 'addresses') and instance.addresses:
+            addresses_dict = dict(instance.addresses)
+        
+        image_dict = {}
+        if hasattr(instance, 'image') and instance.image:
+            if isinstance(instance.image, dict):
+                image_dict = instance.image
+            else:
+                image_dict = {'id': str(instance.image)}
+        
+        flavor_dict = {}
+        if hasattr(instance, 'flavor') and instance.flavor:
+            if isinstance(instance.flavor, dict):
+                flavor_dict = instance.flavor
+            else:
+                flavor_dict = {'id': str(instance.flavor)}
+        
+        instance_data = {
+            'id': instance.id,
+            'name': instance.name,
+            'status': instance.status,
+            'ip_address': instance.ip_address,  # Use the IP from the instance directly
+            'addresses': addresses_dict,
+            'image': image_dict,
+            'flavor': flavor_dict
+        }
+        
         # Create full request with instance_id from URL
         request = DumpRequest(
             instance_id=instance_id,
@@ -160,6 +181,8 @@ async def create_memory_dump(instance_id: str, request_body: DumpRequestBody):
         
         # Create the dump
         dump_id = await memory_dump_service.create_dump(request, instance_data)
+        await invalidate_cache("instances")
+        await invalidate_cache("dashboard")
         
         return DumpResponse(
             dump_id=dump_id,
@@ -174,7 +197,8 @@ async def create_memory_dump(instance_id: str, request_body: DumpRequestBody):
 @router.post("/{instance_id}/forensic-analysis")
 async def create_forensic_analysis(
     instance_id: str,
-    tools: Optional[List[str]] = Query(None, description="Specific tools to use (binwalk, foremost, bulk_extractor, yara, strings, hexdump)")
+    tools: Optional[List[str]] = Query(None, description="Specific tools to use (binwalk, foremost, bulk_extractor, yara, strings, hexdump)"),
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
 ):
     """
     Create comprehensive forensic analysis using multiple tools
@@ -192,18 +216,13 @@ async def create_forensic_analysis(
     """
     try:
         # Get instance name from OpenStack
-        openstack_client = OpenStackClient()
-        instances = await openstack_client.get_instances()
-        
-        instance_name = None
-        for instance in instances:
-            if instance.id == instance_id:
-                instance_name = instance.name
-                break
+        instance = await openstack_client.get_instance(instance_id)
                 
-        if not instance_name:
+        if not instance:
             raise HTTPException(status_code=404, detail="Instance not found")
         
+        instance_name = instance.name
+        
         # Run multi-tool forensic analysis
         analysis_results = await create_multi_tool_analysis(instance_name, tools)
         
@@ -2,21 +2,28 @@
 Metrics API endpoints
 """
 
+from collections import Counter
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from fastapi_cache.decorator import cache
 from pydantic import BaseModel
 from datetime import datetime, timedelta
-import psutil
+import asyncio
 import os
+import time
+import orjson
 import logging
 
 # Import services
-from ...services.openstack import OpenStackClient
+from ..dependencies import get_openstack_client
+from ..responses import OrjsonResponse
 from ...services.memory_dump import memory_dump_service
 from ...services.integrated_forensic import integrated_forensic_service
+from ...services.system_metrics import system_metrics_sampler
 
 router = APIRouter()
-openstack_client = OpenStackClient()
+openstack_client = get_openstack_client()
 logger = logging.getLogger(__name__)
 
 
@@ -34,120 +41,178 @@ class SystemMetrics(BaseModel):
     network_io: List[MetricPoint]
 
 
+# Forensic directory size, reused until the directory signature changes or it gets too old
+_forensic_size_cache: Dict[str, Any] = {"signature": None, "size": 0, "walked_at": 0.0}
+# The signature misses in-place rewrites and files two or more levels down, so
+# the tree is re-walked at least this often (seconds)
+_FORENSIC_SIZE_MAX_AGE = 60
+
+
+def _directory_signature(path: str) -> tuple:
+    """mtimes of a directory and its immediate subdirectories"""
+    # Per-analysis output and reports live one level down, so a new file there
+    # bumps a subdirectory mtime even though the top-level one stays the same
+    with os.scandir(path) as entries:
+        subdirs = sorted(
+            (entry.name, entry.stat().st_mtime_ns)
+            for entry in entries if entry.is_dir(follow_symlinks=False)
+        )
+    return (os.stat(path).st_mtime_ns, tuple(subdirs))
+
+
+def _directory_size(path: str) -> int:
+    """Sum the size of every file below a directory, one stat per file"""
+    total_size = 0
+    # Explicit stack instead of recursion so deep trees can't hit the recursion limit
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        # File removed or unreadable mid-walk
+                        continue
+        except OSError:
+            # Directory removed or unreadable mid-walk
+            continue
+    return total_size
+
+
+def _cached_directory_size(path: str) -> int:
+    """Directory size, walking the tree only when its signature changed or the last walk is stale"""
+    signature = _directory_signature(path)
+    now = time.monotonic()
+    if (signature != _forensic_size_cache["signature"]
+            or now - _forensic_size_cache["walked_at"] >= _FORENSIC_SIZE_MAX_AGE):
+        _forensic_size_cache["size"] = _directory_size(path)
+        _forensic_size_cache["signature"] = signature
+        _forensic_size_cache["walked_at"] = now
+    return _forensic_size_cache["size"]
+
+
+async def _collect_dump_metrics() -> Dict[str, Any]:
+    """Dump statistics"""
+    try:
+        # Counters and size total are maintained by the service as dumps change state
+        stats = memory_dump_service.get_stats()
+        total_dump_size = stats["total_size_bytes"]
+        
+        return {
+            "total": stats["total_dumps"],
+            "completed": stats["completed_dumps"],
+            "failed": stats["failed_dumps"],
+            "in_progress": stats["in_progress_dumps"],
+            "total_size_bytes": total_dump_size,
+            "total_size_gb": round(total_dump_size / (1024**3), 2)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error collecting dump metrics: {e}")
+        return {
+            "total": 0,
+            "completed": 0,
+            "failed": 0,
+            "in_progress": 0,
+            "total_size_bytes": 0,
+            "total_size_gb": 0,
+            "error": str(e)
+        }
+
+
+async def _collect_forensic_metrics() -> Dict[str, Any]:
+    """Forensic analysis statistics"""
+    try:
+        all_analyses = integrated_forensic_service.get_all_analyses()
+        status_counts = Counter(a.status.value for a in all_analyses)
+        
+        return {
+            "total": len(all_analyses),
+            "completed": status_counts["completed"],
+            "failed": status_counts["failed"],
+            "in_progress": status_counts["analyzing"] + status_counts["generating_report"] + status_counts["dumping_memory"]
+        }
+        
+    except Exception as e:
+        logger.error(f"Error collecting forensic metrics: {e}")
+        return {
+            "total": 0,
+            "completed": 0,
+            "failed": 0,
+            "in_progress": 0,
+            "error": str(e)
+        }
+
+
+async def _collect_instance_metrics() -> Dict[str, Any]:
+    """OpenStack instances (if available)"""
+    try:
+        instances = await openstack_client.get_instances()
+        return {
+            "total": len(instances),
+            "active": len([i for i in instances if i.status == "ACTIVE"]),
+            "stopped": len([i for i in instances if i.status in ["SHUTOFF", "STOPPED"]])
+        }
+    except Exception as e:
+        logger.warning(f"Could not get OpenStack instances: {e}")
+        return {
+            "total": 0,
+            "active": 0,
+            "stopped": 0,
+            "error": "OpenStack not available"
+        }
+
+
+async def _collect_app_disk_usage() -> Dict[str, Any]:
+    """Disk space specific to application directories"""
+    app_disk_usage = {}
+    try:
+        # Check forensic reports directory
+        forensic_dir = "/home/stack/forensic"
+        forensic_size = await asyncio.to_thread(_cached_directory_size, forensic_dir)
+        app_disk_usage["forensic_reports"] = {
+            "size_bytes": forensic_size,
+            "size_mb": round(forensic_size / (1024**2), 2)
+        }
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Could not calculate forensic directory size: {e}")
+    return app_disk_usage
+
+
 @router.get("/")
+@cache(expire=10, namespace="metrics")
 async def get_comprehensive_metrics() -> Dict[str, Any]:
     """Get comprehensive system and application metrics"""
     try:
         logger.info("Collecting comprehensive metrics...")
         
         # System metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        net_io = psutil.net_io_counters()
+        snapshot = system_metrics_sampler.get_snapshot()
+        cpu_percent = snapshot["cpu_percent"]
+        memory = snapshot["memory"]
+        disk = snapshot["disk"]
+        net_io = snapshot["net_io"]
         
-        # Dump statistics
-        try:
-            all_dumps = memory_dump_service.get_all_dumps()
-            completed_dumps = len([d for d in all_dumps if d.status.value == "completed"])
-            failed_dumps = len([d for d in all_dumps if d.status.value == "failed"])
-            in_progress_dumps = len([d for d in all_dumps if d.status.value == "in_progress"])
-            
-            # Calculate total dump size
-            total_dump_size = 0
-            for dump in all_dumps:
-                if dump.status.value == "completed" and dump.file_path and os.path.exists(dump.file_path):
-                    try:
-                        total_dump_size += os.path.getsize(dump.file_path)
-                    except Exception as e:
-                        logger.warning(f"Could not get size for dump {dump.id}: {e}")
-            
-            dump_metrics = {
-                "total": len(all_dumps),
-                "completed": completed_dumps,
-                "failed": failed_dumps,
-                "in_progress": in_progress_dumps,
-                "total_size_bytes": total_dump_size,
-                "total_size_gb": round(total_dump_size / (1024**3), 2)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error collecting dump metrics: {e}")
-            dump_metrics = {
-                "total": 0,
-                "completed": 0,
-                "failed": 0,
-                "in_progress": 0,
-                "total_size_bytes": 0,
-                "total_size_gb": 0,
-                "error": str(e)
-            }
-        
-        # Forensic analysis statistics
-        try:
-            all_analyses = integrated_forensic_service.get_all_analyses()
-            completed_analyses = len([a for a in all_analyses if a.status.value == "completed"])
-            failed_analyses = len([a for a in all_analyses if a.status.value == "failed"])
-            in_progress_analyses = len([a for a in all_analyses if a.status.value in ["analyzing", "generating_report", "dumping_memory"]])
-            
-            forensic_metrics = {
-                "total": len(all_analyses),
-                "completed": completed_analyses,
-                "failed": failed_analyses,
-                "in_progress": in_progress_analyses
-            }
-            
-        except Exception as e:
-            logger.error(f"Error collecting forensic metrics: {e}")
-            forensic_metrics = {
-                "total": 0,
-                "completed": 0,
-                "failed": 0,
-                "in_progress": 0,
-                "error": str(e)
-            }
-        
-        # OpenStack instances (if available)
-        try:
-            instances = await openstack_client.get_instances()
-            instance_metrics = {
-                "total": len(instances),
-                "active": len([i for i in instances if i.status == "ACTIVE"]),
-                "stopped": len([i for i in instances if i.status in ["SHUTOFF", "STOPPED"]])
-            }
-        except Exception as e:
-            logger.warning(f"Could not get OpenStack instances: {e}")
-            instance_metrics = {
-                "total": 0,
-                "active": 0,
-                "stopped": 0,
-                "error": "OpenStack not available"
-            }
-        
-        # Disk space specific to application directories
-        app_disk_usage = {}
-        try:
-            # Check forensic reports directory
-            forensic_dir = "/home/stack/forensic"
-            if os.path.exists(forensic_dir):
-                forensic_size = sum(
-                    os.path.getsize(os.path.join(dirpath, filename))
-                    for dirpath, dirnames, filenames in os.walk(forensic_dir)
-                    for filename in filenames
-                )
-                app_disk_usage["forensic_reports"] = {
-                    "size_bytes": forensic_size,
-                    "size_mb": round(forensic_size / (1024**2), 2)
-                }
-        except Exception as e:
-            logger.warning(f"Could not calculate forensic directory size: {e}")
+        # Independent OpenStack and filesystem lookups run concurrently
+        dump_metrics, forensic_metrics, instance_metrics, app_disk_usage = await asyncio.gather(
+            _collect_dump_metrics(),
+            _collect_forensic_metrics(),
+            _collect_instance_metrics(),
+            _collect_app_disk_usage()
+        )
         
         response = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": snapshot["timestamp"],
             "system": {
                 "cpu": {
                     "percent": round(cpu_percent, 2),
-                    "cores": psutil.cpu_count()
+                    "cores": snapshot["cpu_count"]
                 },
                 "memory": {
                     "total": memory.total,
@@ -177,39 +242,65 @@ async def get_comprehensive_metrics() -> Dict[str, Any]:
         }
         
         logger.info("Metrics collected successfully")
-        return response
+        return OrjsonResponse(content=response)
         
     except Exception as e:
         logger.error(f"Error getting comprehensive metrics: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get metrics: {str(e)}")
 
 
+def _system_metrics(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Current system values from a sampler snapshot"""
+    memory = snapshot["memory"]
+    disk = snapshot["disk"]
+    net_io = snapshot["net_io"]
+    
+    return {
+        "timestamp": snapshot["timestamp"],
+        "cpu": round(snapshot["cpu_percent"], 2),
+        "memory": round(memory.percent, 2),
+        "disk": round((disk.used / disk.total) * 100, 2),
+        "network": round((net_io.bytes_sent + net_io.bytes_recv) / (1024**3), 2)  # GB
+    }
+
+
 @router.get("/system")
 async def get_system_metrics():
     """Get current system metrics only"""
     try:
-        # Ottieni solo i valori attuali del sistema
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        net_io = psutil.net_io_counters()
-        
-        # Restituisci solo i dati attuali
-        current_data = {
-            "timestamp": datetime.now().isoformat(),
-            "cpu": round(cpu_percent, 2),
-            "memory": round(memory.percent, 2),
-            "disk": round((disk.used / disk.total) * 100, 2),
-            "network": round((net_io.bytes_sent + net_io.bytes_recv) / (1024**3), 2)  # GB
-        }
-        
-        return current_data
+        # Reads the background sampler's snapshot, so there is nothing worth caching
+        return OrjsonResponse(content=_system_metrics(system_metrics_sampler.get_snapshot()))
         
     except Exception as e:
-        print(f"Error getting system metrics: {e}")
+        logger.error("Error getting system metrics: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _system_metrics_events():
+    """Server-sent events carrying each new sampler snapshot"""
+    snapshot = system_metrics_sampler.get_snapshot()
+    while True:
+        yield b"data: " + orjson.dumps(_system_metrics(snapshot)) + b"\n\n"
+        snapshot = await system_metrics_sampler.wait_for_sample()
+
+
+@router.get("/system/stream")
+async def stream_system_metrics():
+    """Stream current system metrics as server-sent events, one per sample"""
+    return StreamingResponse(
+        _system_metrics_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _hourly_timestamps(hours: int) -> List[datetime]:
+    """Timestamps for the last `hours` hours, newest first"""
+    now = datetime.now()
+    step = timedelta(hours=1)
+    return [now - step * i for i in range(hours)]
+
+
 @router.get("/instances/{instance_id}")
 async def get_instance_metrics(
     instance_id: str,
@@ -218,23 +309,21 @@ async def get_instance_metrics(
     """Get metrics for specific instance"""
     try:
         # Generate sample instance metrics
-        now = datetime.now()
-        metrics = []
-        
-        for i in range(hours):
-            timestamp = now - timedelta(hours=i)
-            metrics.append({
+        metrics = [
+            {
                 "timestamp": timestamp,
                 "cpu_usage": 40.0 + (i % 35),
                 "memory_usage": 55.0 + (i % 30),
                 "network_rx": 20.0 + (i % 25),
                 "network_tx": 15.0 + (i % 20)
-            })
+            }
+            for i, timestamp in enumerate(_hourly_timestamps(hours))
+        ]
         
-        return {
+        return OrjsonResponse(content={
             "instance_id": instance_id,
             "metrics": metrics
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -248,111 +337,118 @@ async def get_service_metrics(
     """Get metrics for specific service"""
     try:
         # Generate sample service metrics
-        now = datetime.now()
-        metrics = []
-        
-        for i in range(hours):
-            timestamp = now - timedelta(hours=i)
-            metrics.append({
+        metrics = [
+            {
                 "timestamp": timestamp,
                 "response_time": 45.0 + (i % 50),
                 "requests_per_second": 100.0 + (i % 80),
                 "error_rate": max(0, 2.0 + (i % 5) - 3)
-            })
+            }
+            for i, timestamp in enumerate(_hourly_timestamps(hours))
+        ]
         
-        return {
+        return OrjsonResponse(content={
             "service_name": service_name,
             "metrics": metrics
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def build_metrics_summary(instances, services) -> Dict[str, Any]:
+    """Build the metrics summary from already fetched instances and services (or the errors raised fetching them)"""
+    # Ottieni solo i valori attuali del sistema
+    snapshot = system_metrics_sampler.get_snapshot()
+    cpu_percent = snapshot["cpu_percent"]
+    memory = snapshot["memory"]
+    disk = snapshot["disk"]
+    
+    # Dati OpenStack con gestione errori
+    running_instances = 0
+    total_instances = 0
+    active_services = 0
+    total_services = 0
+    
+    if isinstance(instances, Exception):
+        logger.warning(f"Could not get OpenStack instances: {instances}")
+    else:
+        running_instances = len([i for i in instances if i.status == 'ACTIVE'])
+        total_instances = len(instances)
+        logger.info(f"OpenStack instances: {running_instances}/{total_instances}")
+    
+    if isinstance(services, Exception):
+        logger.warning(f"Could not get OpenStack services: {services}")
+    else:
+        active_services = len([s for s in services if s.status == 'enabled'])
+        total_services = len(services)
+        logger.info(f"OpenStack services: {active_services}/{total_services}")
+    
+    # Calcola i dettagli della memoria
+    memory_total_gb = round(memory.total / (1024**3), 2)
+    memory_used_gb = round(memory.used / (1024**3), 2)
+    memory_available_gb = round(memory.available / (1024**3), 2)
+    
+    # Dati applicazione
+    try:
+        dump_stats = memory_dump_service.get_stats()
+        active_services += dump_stats["completed_dumps"]
+        total_services += dump_stats["total_dumps"]
+    except Exception as e:
+        logger.warning(f"Could not get dump data: {e}")
+    
+    try:
+        all_analyses = integrated_forensic_service.get_all_analyses()
+        completed_analyses = sum(1 for a in all_analyses if a.status.value == "completed")
+        active_services += completed_analyses
+        total_services += len(all_analyses)
+    except Exception as e:
+        logger.warning(f"Could not get forensic data: {e}")
+    
+    # Restituisci solo i dati attuali
+    return {
+        "cpu": {
+            "current": round(cpu_percent, 1),
+            "unit": "%"
+        },
+        "memory": {
+            "current": round(memory.percent, 1),
+            "unit": "%",
+            "total_gb": memory_total_gb,
+            "used_gb": memory_used_gb,
+            "available_gb": memory_available_gb
+        },
+        "disk": {
+            "current": round((disk.used / disk.total) * 100, 1),
+            "unit": "%"
+        },
+        "instances": {
+            "running": running_instances,
+            "total": total_instances
+        },
+        "services": {
+            "active": active_services,
+            "total": total_services
+        }
+    }
+
+
 @router.get("/summary")
+@cache(expire=10, namespace="metrics")
 async def get_metrics_summary():
     """Get current metrics summary with error handling"""
     try:
         logger.info("Getting metrics summary...")
         
-        # Ottieni solo i valori attuali del sistema
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        # Dati OpenStack con gestione errori
-        running_instances = 0
-        total_instances = 0
-        active_services = 0
-        total_services = 0
-        
-        try:
-            instances = await openstack_client.get_instances()
-            running_instances = len([i for i in instances if i.status == 'ACTIVE'])
-            total_instances = len(instances)
-            logger.info(f"OpenStack instances: {running_instances}/{total_instances}")
-        except Exception as e:
-            logger.warning(f"Could not get OpenStack instances: {e}")
-        
-        try:
-            services = await openstack_client.get_services()
-            active_services = len([s for s in services if s.status == 'enabled'])
-            total_services = len(services)
-            logger.info(f"OpenStack services: {active_services}/{total_services}")
-        except Exception as e:
-            logger.warning(f"Could not get OpenStack services: {e}")
-        
-        # Calcola i dettagli della memoria
-        memory_total_gb = round(memory.total / (1024**3), 2)
-        memory_used_gb = round(memory.used / (1024**3), 2)
-        memory_available_gb = round(memory.available / (1024**3), 2)
-        
-        # Dati applicazione
-        try:
-            all_dumps = memory_dump_service.get_all_dumps()
-            completed_dumps = len([d for d in all_dumps if d.status.value == "completed"])
-            active_services += completed_dumps
-            total_services += len(all_dumps)
-        except Exception as e:
-            logger.warning(f"Could not get dump data: {e}")
-        
-        try:
-            all_analyses = integrated_forensic_service.get_all_analyses()
-            completed_analyses = len([a for a in all_analyses if a.status.value == "completed"])
-            active_services += completed_analyses
-            total_services += len(all_analyses)
-        except Exception as e:
-            logger.warning(f"Could not get forensic data: {e}")
-        
-        # Restituisci solo i dati attuali
-        summary = {
-            "cpu": {
-                "current": round(cpu_percent, 1),
-                "unit": "%"
-            },
-            "memory": {
-                "current": round(memory.percent, 1),
-                "unit": "%",
-                "total_gb": memory_total_gb,
-                "used_gb": memory_used_gb,
-                "available_gb": memory_available_gb
-            },
-            "disk": {
-                "current": round((disk.used / disk.total) * 100, 1),
-                "unit": "%"
-            },
-            "instances": {
-                "running": running_instances,
-                "total": total_instances
-            },
-            "services": {
-                "active": active_services,
-                "total": total_services
-            }
-        }
+        instances, services = await asyncio.gather(
+            openstack_client.get_instances(),
+            openstack_client.get_services(),
+            return_exceptions=True
+        )
+        summary = build_metrics_summary(instances, services)
         
         logger.info("Metrics summary collected successfully")
-        return summary
+        return OrjsonResponse(content=summary)
         
     except Exception as e:
         logger.error(f"Error getting metrics summary: {e}", exc_info=True)
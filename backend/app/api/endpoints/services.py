@@ -3,10 +3,16 @@ Services API endpoints
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi_cache.decorator import cache
+from pydantic import BaseModel, TypeAdapter
 
+from app.api.dependencies import get_openstack_client
+from app.api.responses import RawJSONResponse, SerializedListCache
+from app.core.cache import cached_or_refresh, invalidate_cache
+from app.core.config import settings
 from app.services.openstack import OpenStackClient
+from app.services.system_metrics import system_metrics_sampler
 from app.models.service import Service, ServiceStatus
 
 router = APIRouter()
@@ -23,38 +29,54 @@ class ServiceResponse(BaseModel):
     last_check: str
 
 
+# Encoded service lists, reused while the cached OpenStack listing is unchanged
+_service_lists = SerializedListCache(
+    TypeAdapter(List[Service]), include=set(ServiceResponse.model_fields)
+)
+
+
 @router.get("", response_model=List[ServiceResponse])
 async def get_services(
     status: Optional[ServiceStatus] = Query(None, description="Filter by status"),
-    search: Optional[str] = Query(None, description="Search by name")
+    search: Optional[str] = Query(None, description="Search by name"),
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
 ):
     """Get all OpenStack services"""
     try:
-        openstack_client = OpenStackClient()
-        services = await openstack_client.get_services()
-        
-        # Apply filters
-        if status:
-            services = [s for s in services if s.status == status]
+        services, stale = await cached_or_refresh(
+            "services:all",
+            openstack_client.get_services,
+            ttl=settings.OPENSTACK_CACHE_TTL,
+            stale_ttl=settings.OPENSTACK_STALE_TTL
+        )
+        headers = {"X-Cache": "stale"} if stale else None
         
-        if search:
-            search_lower = search.lower()
-            services = [
-                s for s in services 
-                if search_lower in s.name.lower() or search_lower in s.description.lower()
-            ]
+        def build():
+            # Apply filters
+            filtered = services
+            if status:
+                filtered = [s for s in filtered if s.status == status]
+            
+            if search:
+                search_lower = search.lower()
+                filtered = [s for s in filtered if search_lower in s.search_text]
+            
+            return filtered
         
-        return services
+        body = _service_lists.get((status, search), services, build)
+        return RawJSONResponse(content=body, headers=headers)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{service_name}", response_model=ServiceResponse)
-async def get_service(service_name: str):
+async def get_service(
+    service_name: str,
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
+):
     """Get specific service details"""
     try:
-        openstack_client = OpenStackClient()
         service = await openstack_client.get_service(service_name)
         
         if not service:
@@ -67,16 +89,20 @@ async def get_service(service_name: str):
 
 
 @router.post("/{service_name}/health-check")
-async def check_service_health(service_name: str):
+async def check_service_health(
+    service_name: str,
+    openstack_client: OpenStackClient = Depends(get_openstack_client)
+):
     """Force health check for specific service"""
     try:
-        openstack_client = OpenStackClient()
         health_status = await openstack_client.check_service_health(service_name)
+        await invalidate_cache("services")
+        await invalidate_cache("dashboard")
         
         return {
             "service_name": service_name,
             "health_status": health_status,
-            "timestamp": "2024-01-01T00:00:00Z"
+            "timestamp": system_metrics_sampler.get_timestamp()
         }
     
     except Exception as e:
@@ -84,10 +110,10 @@ async def check_service_health(service_name: str):
 
 
 @router.get("/stats/summary")
-async def get_services_summary():
+@cache(expire=10, namespace="services")
+async def get_services_summary(openstack_client: OpenStackClient = Depends(get_openstack_client)):
     """Get services summary statistics"""
     try:
-        openstack_client = OpenStackClient()
         summary = await openstack_client.get_services_summary()
         
         return summary
@@ -2,20 +2,20 @@
 System information endpoint
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any
 import logging
 
+from app.api.dependencies import get_openstack_client
 from app.services.openstack import OpenStackClient
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 @router.get("/info", response_model=Dict[str, Any])
-async def get_system_info():
+async def get_system_info(client: OpenStackClient = Depends(get_openstack_client)):
     """Get DevStack system information including uptime"""
     try:
-        client = OpenStackClient()
         system_info = await client.get_system_info()
         return system_info
     except Exception as e:
@@ -23,10 +23,9 @@ async def get_system_info():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/uptime")
-async def get_system_uptime():
+async def get_system_uptime(client: OpenStackClient = Depends(get_openstack_client)):
     """Get DevStack system uptime"""
     try:
-        client = OpenStackClient()
         uptime_info = await client.get_system_uptime()
         return uptime_info
     except Exception as e:
@@ -34,11 +33,9 @@ async def get_system_uptime():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/connection/test")
-async def test_openstack_connection():
+async def test_openstack_connection(client: OpenStackClient = Depends(get_openstack_client)):
     """Test OpenStack connection and return connection details"""
     try:
-        client = OpenStackClient()
-        
         # Test connection
         connection_result = await client.test_connection()
         
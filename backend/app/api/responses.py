@@ -0,0 +1,120 @@
+"""
+Shared API response classes
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+class LargeFileResponse(FileResponse):
+    """FileResponse tuned for multi-GB memory dumps and forensic reports"""
+    
+    # 1 MiB reads instead of Starlette's 64 KiB default to cut syscalls on large files.
+    # Servers that support the ASGI pathsend extension bypass this and send the file zero-copy.
+    chunk_size = 1024 * 1024
+    
+    def __init__(self, path: str, **kwargs):
+        # Stat once up front so Content-Length is set here and Starlette skips its own stat
+        stat_result = kwargs.pop("stat_result", None) or os.stat(path)
+        super().__init__(path, stat_result=stat_result, **kwargs)
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse encoded with orjson (FastAPI's own ORJSONResponse is deprecated)"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class RawJSONResponse(JSONResponse):
+    """JSONResponse whose content is already encoded JSON bytes"""
+    
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+class SerializedListCache:
+    """Keeps the encoded JSON of recent list responses while their source list is unchanged"""
+    
+    def __init__(self, adapter: TypeAdapter, include: Optional[set] = None, maxsize: int = 8):
+        self.adapter = adapter
+        # Limit each element to the response model's fields, as response_model would
+        self.include = {"__all__": include} if include else None
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    
+    def get(self, key: Hashable, source: Any, build: Callable[[], Any]) -> bytes:
+        """Return the JSON for key, re-encoding build() only if source is a different object"""
+        entry = self._entries.get(key)
+        if entry and entry[0] is source:
+            self._entries.move_to_end(key)
+            return entry[1]
+        
+        body = self.adapter.dump_json(build(), include=self.include)
+        self._entries[key] = (source, body)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return body
+
+
+def make_etag(payload: bytes) -> str:
+    """Build a strong ETag from response bytes or another stable fingerprint"""
+    return f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match list names etag, using the weak comparison GET requires"""
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison ignores the W/ prefix on either side
+    etag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already holds the representation tagged etag"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def json_bytes_response(body: bytes, request: Request, etag: Optional[str] = None) -> Response:
+    """Return pre-encoded JSON with an ETag, or 304 if the client's copy is current"""
+    etag = etag or make_etag(body)
+    return not_modified(request, etag) or Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
+    )
+
+
+def _iter_json_array(items: Iterable[Any]) -> Iterator[bytes]:
+    """Encode items one at a time as the elements of a JSON array"""
+    yield b"["
+    first = True
+    for item in items:
+        if not first:
+            yield b","
+        first = False
+        yield orjson.dumps(item)
+    yield b"]"
+
+
+def stream_json(items: Iterable[Any]) -> StreamingResponse:
+    """Stream JSON-serializable items as a JSON array, encoding each as it is produced"""
+    return StreamingResponse(_iter_json_array(items), media_type="application/json")
+
+
+def stream_json_array(items: Iterable[BaseModel]) -> StreamingResponse:
+    """Stream a list of models as a JSON array without building an intermediate list of dicts"""
+    return stream_json(item.model_dump() for item in items)
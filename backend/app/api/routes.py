@@ -4,7 +4,7 @@ Main API router
 
 from fastapi import APIRouter
 
-from .endpoints import instances, services, metrics, alerts, system, dumps, forensics, forensic
+from .endpoints import instances, services, metrics, alerts, system, dumps, forensics, forensic, dashboard
 
 api_router = APIRouter()
 
@@ -16,4 +16,5 @@ api_router.include_router(alerts.router, prefix="/alerts", tags=["alerts"])
 api_router.include_router(system.router, prefix="/system", tags=["system"])
 api_router.include_router(dumps.router, prefix="/dumps", tags=["memory-dumps"])
 api_router.include_router(forensics.router, prefix="/forensics", tags=["forensics"])
-api_router.include_router(forensic.router, prefix="/integrated-forensic", tags=["integrated-forensic"])
\ No newline at end of file
+api_router.include_router(forensic.router, prefix="/integrated-forensic", tags=["integrated-forensic"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Response cache configuration (fastapi-cache2 backed by Redis)
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "fastapi-cache"
+
+_KEY_TYPES = (str, int, float, bool, Enum, list, tuple)
+
+# Stale-while-revalidate entries: key -> (fresh_until, stale_until, value)
+_swr_entries: Dict[str, Tuple[float, float, Any]] = {}
+_swr_refreshes: Dict[str, asyncio.Task] = {}
+
+
+def request_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Build a cache key from the endpoint's query/path values, ignoring injected objects"""
+    # Dependencies such as Request, Response or a shared client repr() differently per
+    # process, which would split the cache between workers
+    params = {
+        key: value for key, value in (kwargs or {}).items()
+        if value is None or isinstance(value, _KEY_TYPES)
+    }
+    raw_key = f"{func.__module__}:{func.__name__}:{args}:{sorted(params.items())}"
+    # namespace already carries the cache prefix, which FastAPICache.clear() matches on
+    return f"{namespace}:{hashlib.md5(raw_key.encode()).hexdigest()}"
+
+
+async def setup_cache():
+    """Initialize the response cache, falling back to in-memory storage if Redis is unreachable"""
+    try:
+        redis = aioredis.from_url(settings.REDIS_URL)
+        await redis.ping()
+        backend = RedisBackend(redis)
+        logger.info(f"Response cache using Redis at {settings.REDIS_URL}")
+    except Exception as e:
+        logger.warning(f"Redis not available ({e}), using in-memory response cache")
+        backend = InMemoryBackend()
+
+    FastAPICache.init(backend, prefix=CACHE_PREFIX, key_builder=request_key_builder)
+
+
+async def invalidate_cache(namespace: str):
+    """Clear all cached responses and stale-while-revalidate entries in a namespace"""
+    prefix = f"{namespace}:"
+    for key in [key for key in _swr_entries if key.startswith(prefix)]:
+        del _swr_entries[key]
+    # A refresh started before the invalidation would store pre-invalidation data as fresh
+    for key in [key for key in _swr_refreshes if key.startswith(prefix)]:
+        _swr_refreshes.pop(key).cancel()
+    try:
+        await FastAPICache.clear(namespace=namespace)
+    except Exception as e:
+        logger.debug(f"Could not clear cache namespace {namespace}: {e}")
+
+
+async def _swr_load(key: str, loader: Callable[[], Awaitable[Any]], ttl: float, stale_ttl: float) -> Any:
+    """Run the loader and store its result as a fresh entry"""
+    value = await loader()
+    now = time.monotonic()
+    _swr_entries[key] = (now + ttl, now + ttl + stale_ttl, value)
+    return value
+
+
+async def _swr_refresh(key: str, loader: Callable[[], Awaitable[Any]], ttl: float, stale_ttl: float):
+    """Background refresh; on failure the stale entry keeps being served"""
+    try:
+        await _swr_load(key, loader, ttl, stale_ttl)
+    except Exception as e:
+        logger.warning(f"Background refresh of {key} failed, serving stale data: {e}")
+    finally:
+        # After an invalidation the slot may already belong to a newer refresh
+        if _swr_refreshes.get(key) is asyncio.current_task():
+            del _swr_refreshes[key]
+
+
+async def cached_or_refresh(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: float,
+    stale_ttl: float,
+) -> Tuple[Any, bool]:
+    """
+    Stale-while-revalidate lookup, returning (value, is_stale)
+    
+    Fresh entries are returned as is. Entries past ttl but within stale_ttl are
+    returned immediately while one background task reloads them. Anything older
+    (or missing) is loaded inline.
+    """
+    now = time.monotonic()
+    entry = _swr_entries.get(key)
+    if entry:
+        fresh_until, stale_until, value = entry
+        if now < fresh_until:
+            return value, False
+        if now < stale_until:
+            if key not in _swr_refreshes:
+                _swr_refreshes[key] = asyncio.create_task(_swr_refresh(key, loader, ttl, stale_ttl))
+            return value, True
+    
+    return await _swr_load(key, loader, ttl, stale_ttl), False
@@ -3,8 +3,121 @@ Application configuration settings - FIXED VERSION
 """
 
 import os
-from typing import List, Optional
-from pydantic_settings import BaseSettings
+import re
+import subprocess
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
+
+# OpenStack credential fields filled from the environment or DevStack's openrc
+_OPENSTACK_CREDENTIAL_KEYS = (
+    'OS_AUTH_URL',
+    'OS_PROJECT_NAME',
+    'OS_USERNAME',
+    'OS_PASSWORD',
+    'OS_USER_DOMAIN_NAME',
+    'OS_PROJECT_DOMAIN_NAME',
+)
+
+DEVSTACK_OPENRC_PATH = "/opt/stack/devstack/openrc"
+
+# Plain `[export] OS_FOO=value` assignments, optionally quoted
+_OPENRC_RE = re.compile(r'''^(?:export\s+)?(OS_[A-Z_]+)=["']?([^"'\n]+?)["']?\s*$''', re.M)
+
+
+class LazyMapping(Mapping):
+    """Read-only mapping that builds its data on first access"""
+    
+    def __init__(self, loader):
+        self._loader = loader
+        self._data: Optional[Dict[str, str]] = None
+    
+    @property
+    def data(self) -> Dict[str, str]:
+        if self._data is None:
+            self._data = self._loader()
+        return self._data
+    
+    def __getitem__(self, key: str) -> str:
+        return self.data[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+    
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+def _parse_openrc(text: str) -> Dict[str, str]:
+    """Collect credentials assigned literally in an openrc file"""
+    credentials = {}
+    for key, value in _OPENRC_RE.findall(text):
+        # Values built from other variables or commands need a shell to expand
+        if key in _OPENSTACK_CREDENTIAL_KEYS and '$' not in value and '`' not in value:
+            credentials[key] = value
+    return credentials
+
+
+def _read_openrc(openrc_path: str) -> Dict[str, str]:
+    """Read the OpenStack credentials exported by an openrc file"""
+    credentials = {}
+    try:
+        with open(openrc_path) as f:
+            credentials = _parse_openrc(f.read())
+        
+        # DevStack's own openrc derives its values from stackrc/local.conf, so anything
+        # not assigned literally falls back to having bash source it
+        if all(key in credentials for key in _OPENSTACK_CREDENTIAL_KEYS):
+            return credentials
+        
+        result = subprocess.run(
+            ['/bin/bash', '-c', f'source "{openrc_path}" admin admin && env'],
+            capture_output=True,
+            text=True
+        )
+        
+        if result.returncode == 0:
+            for line in result.stdout.splitlines():
+                key, sep, value = line.partition('=')
+                if sep and key in _OPENSTACK_CREDENTIAL_KEYS:
+                    credentials[key] = value
+    except Exception as e:
+        # If auto-detection fails, use defaults
+        pass
+    return credentials
+
+
+class DevStackOpenrcSource(PydanticBaseSettingsSource):
+    """
+    Settings source for OpenStack credentials exported by DevStack's openrc
+    
+    Fills only the credentials earlier sources (init, environment, .env) left
+    unset. Settings are built at import, so openrc is still read then; the lazy
+    mapping just means it isn't read (or sourced through bash) at all when every
+    credential was already supplied.
+    """
+    
+    def __init__(self, settings_cls: Type[BaseSettings], openrc_path: str = DEVSTACK_OPENRC_PATH):
+        super().__init__(settings_cls)
+        self.openrc_path = openrc_path
+        self.credentials = LazyMapping(lambda: _read_openrc(self.openrc_path))
+    
+    def _missing_credentials(self) -> List[str]:
+        """Credential fields no earlier source supplied"""
+        return [key for key in _OPENSTACK_CREDENTIAL_KEYS if key not in self.current_state]
+    
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
+        return self.credentials.get(field_name), field_name, False
+    
+    def __call__(self) -> Dict[str, Any]:
+        values = {}
+        for field_name in self._missing_credentials():
+            value, key, _ = self.get_field_value(self.settings_cls.model_fields[field_name], field_name)
+            if value is not None:
+                values[key] = value
+        return values
 
 
 class Settings(BaseSettings):
@@ -27,6 +140,8 @@ class Settings(BaseSettings):
     MONITOR_INTERVAL: int = 30  # seconds
     MONITOR_TIMEOUT: int = 10   # seconds
     MONITOR_RETRIES: int = 3
+    STORE_COMPACTION_INTERVAL: int = 300  # seconds between dropping deleted records
+    METRICS_SAMPLE_INTERVAL: int = 2  # seconds between psutil samples
     
     # Alert thresholds
     CPU_THRESHOLD: float = 80.0
@@ -45,61 +160,40 @@ class Settings(BaseSettings):
     DUMP_REMOTE_DIRECTORY: str = "/tmp/dumps"
     OPENSTACK_HOST: str = "192.168.78.190"  # OpenStack server IP for SSH connections
     
+    # Response cache settings
+    REDIS_URL: str = "redis://localhost:6379/0"
+    OPENSTACK_CACHE_TTL: int = 10  # seconds OpenStack listings are served without refreshing
+    OPENSTACK_STALE_TTL: int = 300  # seconds a stale listing may be served while refreshing
+    MOCK_DELAY: float = 0.0  # seconds of simulated latency for mock data (only applied when DEBUG)
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        
-        # Auto-detect DevStack credentials if available
-        self._load_devstack_credentials()
-    
-    def _load_devstack_credentials(self):
-        """Load DevStack credentials from environment or openrc file"""
-        try:
-            # Try to load from current environment first
-            if os.getenv('OS_AUTH_URL'):
-                self.OS_AUTH_URL = os.getenv('OS_AUTH_URL', self.OS_AUTH_URL)
-                self.OS_PROJECT_NAME = os.getenv('OS_PROJECT_NAME', self.OS_PROJECT_NAME)
-                self.OS_USERNAME = os.getenv('OS_USERNAME', self.OS_USERNAME)
-                self.OS_PASSWORD = os.getenv('OS_PASSWORD', self.OS_PASSWORD)
-                self.OS_USER_DOMAIN_NAME = os.getenv('OS_USER_DOMAIN_NAME', self.OS_USER_DOMAIN_NAME)
-                self.OS_PROJECT_DOMAIN_NAME = os.getenv('OS_PROJECT_DOMAIN_NAME', self.OS_PROJECT_DOMAIN_NAME)
-                return
-            
-            # Try to source openrc file if environment variables are not set
-            openrc_path = "/opt/stack/devstack/openrc"
-            if os.path.exists(openrc_path):
-                import subprocess
-                result = subprocess.run(
-                    f"source {openrc_path} admin admin && env | grep ^OS_",
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    executable='/bin/bash'
-                )
-                
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n'):
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            if key == 'OS_AUTH_URL':
-                                self.OS_AUTH_URL = value
-                            elif key == 'OS_PROJECT_NAME':
-                                self.OS_PROJECT_NAME = value
-                            elif key == 'OS_USERNAME':
-                                self.OS_USERNAME = value
-                            elif key == 'OS_PASSWORD':
-                                self.OS_PASSWORD = value
-                            elif key == 'OS_USER_DOMAIN_NAME':
-                                self.OS_USER_DOMAIN_NAME = value
-                            elif key == 'OS_PROJECT_DOMAIN_NAME':
-                                self.OS_PROJECT_DOMAIN_NAME = value
-        except Exception as e:
-            # If auto-detection fails, use defaults
-            pass
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Fall back to DevStack's openrc for credentials not set in the environment"""
+        return (
+            init_settings,
+            env_settings,
+            dotenv_settings,
+            DevStackOpenrcSource(settings_cls),
+            file_secret_settings,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, loading them on first use"""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
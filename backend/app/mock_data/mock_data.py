@@ -1,24 +1,31 @@
 import asyncio
 from datetime import datetime
+from app.core.config import settings
 from app.models.instance import Instance, InstanceStatus
 from app.models.service import Service, ServiceStatus
 
+async def _simulate_latency():
+    """Optionally delay mock responses to mimic a real OpenStack round trip"""
+    if settings.DEBUG and settings.MOCK_DELAY > 0:
+        await asyncio.sleep(settings.MOCK_DELAY)
+
 async def get_mock_instances():
     """Return empty list when no OpenStack connection - don't show mock data in instances page"""
-    await asyncio.sleep(0.1)
+    await _simulate_latency()
     return []
 
+# Connection error service; only last_check changes between calls
+_MOCK_SERVICE_TEMPLATE = Service(
+    name="openstack-connection",
+    status=ServiceStatus.CRITICAL,
+    description="OpenStack Connection Failed - DevStack not running on localhost:5000",
+    port=5000,
+    uptime="0h 0m",
+    response_time=0.0,
+    last_check=""
+)
+
 async def get_mock_services():
     """Return connection error service when no OpenStack connection"""
-    await asyncio.sleep(0.1)
-    return [
-        Service(
-            name="openstack-connection",
-            status=ServiceStatus.CRITICAL,
-            description="OpenStack Connection Failed - DevStack not running on localhost:5000",
-            port=5000,
-            uptime="0h 0m",
-            response_time=0.0,
-            last_check=datetime.now().isoformat()
-        )
-    ]
+    await _simulate_latency()
+    return [_MOCK_SERVICE_TEMPLATE.model_copy(update={"last_check": datetime.now().isoformat()})]
@@ -3,7 +3,7 @@ Memory dump model for digital forensics
 """
 
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from enum import Enum
 
@@ -41,6 +41,8 @@ class MemoryDump(BaseModel):
 
 class DumpRequest(BaseModel):
     """Memory dump request model"""
+    model_config = ConfigDict(frozen=True)
+    
     instance_id: str
     dump_type: DumpType = DumpType.PHYSICAL_RAM
     ssh_key_path: Optional[str] = None
@@ -5,7 +5,7 @@ Forensic analysis models for memory dump analysis
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AnalysisStatus(str, Enum):
@@ -28,6 +28,8 @@ class AnalysisType(str, Enum):
 
 class ProcessInfo(BaseModel):
     """Process information from pslist"""
+    model_config = ConfigDict(frozen=True)
+    
     pid: int
     ppid: int
     name: str
@@ -40,6 +42,8 @@ class ProcessInfo(BaseModel):
 
 class NetworkConnection(BaseModel):
     """Network connection information"""
+    model_config = ConfigDict(frozen=True)
+    
     protocol: str
     local_addr: str
     local_port: int
@@ -52,6 +56,8 @@ class NetworkConnection(BaseModel):
 
 class OpenFile(BaseModel):
     """Open file information"""
+    model_config = ConfigDict(frozen=True)
+    
     pid: int
     process: str
     fd: str
@@ -61,6 +67,8 @@ class OpenFile(BaseModel):
 
 class KernelModule(BaseModel):
     """Kernel module information"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     size: int
     instances: int
@@ -70,6 +78,8 @@ class KernelModule(BaseModel):
 
 class SystemInfo(BaseModel):
     """System information from banner/info"""
+    model_config = ConfigDict(frozen=True)
+    
     kernel_version: str
     architecture: str
     hostname: Optional[str] = None
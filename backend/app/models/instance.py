@@ -3,7 +3,8 @@ Instance data models
 """
 
 from enum import Enum
-from pydantic import BaseModel
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -18,6 +19,8 @@ class InstanceStatus(str, Enum):
 
 class Instance(BaseModel):
     """Instance model"""
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+    
     id: str
     name: str
     status: InstanceStatus
@@ -33,5 +36,7 @@ class Instance(BaseModel):
     created_at: str
     updated_at: Optional[str] = None
     
-    class Config:
-        use_enum_values = True
\ No newline at end of file
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased name and image, separated so a match can't span both"""
+        return f"{self.name}\0{self.image}".lower()
@@ -3,7 +3,8 @@ Service data models
 """
 
 from enum import Enum
-from pydantic import BaseModel
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -17,6 +18,8 @@ class ServiceStatus(str, Enum):
 
 class Service(BaseModel):
     """Service model"""
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+    
     name: str
     status: ServiceStatus
     description: str
@@ -27,5 +30,7 @@ class Service(BaseModel):
     endpoint_url: Optional[str] = None
     version: Optional[str] = None
     
-    class Config:
-        use_enum_values = True
\ No newline at end of file
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased name and description, separated so a match can't span both"""
+        return f"{self.name}\0{self.description}".lower()
@@ -1,10 +1,24 @@
 import asyncio
+import bisect
 import subprocess
-import json
 import os
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+import orjson
+
+from app.services.forensic_parsers import read_head_lines, read_json, read_text, sample_interesting_strings
+
+# libmagic identifies dump types in-process; fall back to the `file` command without it
+try:
+    import magic
+    MAGIC_AVAILABLE = True
+except ImportError:
+    MAGIC_AVAILABLE = False
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 class CustomForensicAnalyzer:
     """
     Custom forensic analyzer that works without Volatility
@@ -14,6 +28,12 @@ class CustomForensicAnalyzer:
     def __init__(self, project_root: str = "/home/stack/plugin1/project"):
         self.project_root = Path(project_root)
         self.script_path = self.project_root / "custom-forensic-analysis.sh"
+        self._script_ready = False
+        # dump path -> ((mtime_ns, size), summary); a rewritten dump changes the signature
+        self._summary_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        # A libmagic cookie isn't thread-safe, so calls through it are serialized
+        self._magic = None
+        self._magic_lock = threading.Lock()
     
     async def analyze_memory_dump(self, dump_file_path: str) -> Dict[str, Any]:
         """
@@ -26,15 +46,8 @@ class CustomForensicAnalyzer:
             Dict containing analysis results
         """
         try:
-            # Ensure the dump file exists
-            if not os.path.exists(dump_file_path):
-                return {
-                    "error": f"Dump file not found: {dump_file_path}",
-                    "status": "failed"
-                }
-            
             # Make sure the analysis script is executable
-            await self._ensure_script_executable()
+            self._ensure_script_executable()
             
             # Run the custom forensic analysis
             process = await asyncio.create_subprocess_exec(
@@ -45,9 +58,19 @@ class CustomForensicAnalyzer:
                 cwd=str(self.project_root)
             )
             
-            stdout, stderr = await process.communicate()
+            # stderr is drained alongside so a chatty script can't block on a full pipe
+            stderr_task = asyncio.create_task(process.stderr.read())
+            analysis_log, analysis_dir, json_file = await self._read_script_output(process.stdout)
+            stderr = await stderr_task
+            await process.wait()
             
             if process.returncode != 0:
+                # The script fails on a missing dump too; only then is it worth a stat()
+                if not os.path.exists(dump_file_path):
+                    return {
+                        "error": f"Dump file not found: {dump_file_path}",
+                        "status": "failed"
+                    }
                 return {
                     "error": f"Analysis failed: {stderr.decode()}",
                     "status": "failed",
@@ -55,7 +78,7 @@ class CustomForensicAnalyzer:
                 }
             
             # Parse the JSON output from the analysis
-            analysis_results = await self._parse_analysis_results(stdout.decode())
+            analysis_results = await self._parse_analysis_results(analysis_log, analysis_dir, json_file)
             
             return analysis_results
             
@@ -65,45 +88,65 @@ class CustomForensicAnalyzer:
                 "status": "failed"
             }
     
-    async def _ensure_script_executable(self):
-        """Make sure the analysis script is executable"""
+    def _ensure_script_executable(self):
+        """Make sure the analysis script is executable (once per analyzer)"""
+        if self._script_ready:
+            return
         try:
-            await asyncio.create_subprocess_exec(
-                "chmod", "+x", str(self.script_path),
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL
-            )
-        except Exception:
+            st = os.stat(self.script_path)
+            os.chmod(self.script_path, st.st_mode | 0o111)
+            self._script_ready = True
+        except OSError:
             pass  # Ignore errors, script might already be executable
     
-    async def _parse_analysis_results(self, stdout: str) -> Dict[str, Any]:
+    async def _read_script_output(self, stream: asyncio.StreamReader) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        Read the analysis script's stdout as it runs, picking out the result locations
+        
+        Args:
+            stream: The script's stdout pipe
+            
+        Returns:
+            Tuple of (full log, analysis directory, JSON output file)
+        """
+        log = []
+        analysis_dir = None
+        json_file = None
+        
+        async for raw_line in stream:
+            line = raw_line.decode(errors='replace')
+            log.append(line)
+            if "Analysis directory:" in line:
+                analysis_dir = line.split("Analysis directory:", 1)[1].strip()
+            elif "JSON output for API:" in line:
+                json_file = line.split("JSON output for API:", 1)[1].strip()
+        
+        return "".join(log), analysis_dir, json_file
+    
+    async def _parse_analysis_results(
+        self,
+        stdout: str,
+        analysis_dir: Optional[str],
+        json_file: Optional[str]
+    ) -> Dict[str, Any]:
         """
-        Parse the analysis results from stdout and JSON file
+        Parse the analysis results from the JSON file and analysis directory
         
         Args:
             stdout: Standard output from the analysis script
+            analysis_dir: Analysis directory reported by the script
+            json_file: JSON output file reported by the script
             
         Returns:
             Dict containing parsed analysis results
         """
         try:
-            # Extract the analysis directory from stdout
-            analysis_dir = None
-            json_file = None
-            
-            for line in stdout.split('\n'):
-                if "Analysis directory:" in line:
-                    analysis_dir = line.split(":")[-1].strip()
-                elif "JSON output for API:" in line:
-                    json_file = line.split(":")[-1].strip()
-            
             # Try to read the JSON output file
-            if json_file and os.path.exists(json_file):
-                with open(json_file, 'r') as f:
-                    json_results = json.load(f)
-                
-                # Add additional parsed information from analysis files
-                if analysis_dir and os.path.exists(analysis_dir):
+            json_results = await asyncio.to_thread(read_json, json_file) if json_file else None
+            
+            if json_results is not None:
+                # Add additional parsed information from analysis files (missing ones are skipped)
+                if analysis_dir:
                     json_results.update(await self._parse_analysis_files(analysis_dir))
                 
                 # Add the stdout log for debugging
@@ -137,46 +180,26 @@ class CustomForensicAnalyzer:
             Dict with parsed file contents
         """
         parsed_data = {}
+        analysis_path = Path(analysis_dir)
         
-        try:
-            analysis_path = Path(analysis_dir)
-            
-            # Parse executables list
-            executables_file = analysis_path / "executables.txt"
-            if executables_file.exists():
-                with open(executables_file, 'r') as f:
-                    parsed_data["executables"] = [line.strip() for line in f.readlines()[:20]]  # Limit to 20
-            
-            # Parse IP addresses
-            ips_file = analysis_path / "ip_addresses.txt"
-            if ips_file.exists():
-                with open(ips_file, 'r') as f:
-                    parsed_data["ip_addresses"] = [line.strip() for line in f.readlines()[:50]]  # Limit to 50
-            
-            # Parse file info
-            file_info = analysis_path / "file_info.txt"
-            if file_info.exists():
-                with open(file_info, 'r') as f:
-                    parsed_data["file_type"] = f.read().strip()
-            
+        # The artifacts are independent, so read them concurrently off the event loop
+        parsers = {
+            "executables": (read_head_lines, str(analysis_path / "executables.txt"), 20),
+            "ip_addresses": (read_head_lines, str(analysis_path / "ip_addresses.txt"), 50),
+            "file_type": (read_text, str(analysis_path / "file_info.txt")),
             # Parse quick strings for interesting patterns
-            quick_strings = analysis_path / "quick_strings.txt"
-            if quick_strings.exists():
-                with open(quick_strings, 'r') as f:
-                    lines = f.readlines()
-                    # Look for interesting patterns
-                    parsed_data["sample_strings"] = {
-                        "system_calls": [line.strip() for line in lines if any(syscall in line.lower() for syscall in ['open', 'read', 'write', 'connect', 'bind'])],
-                        "file_paths": [line.strip() for line in lines if line.strip().startswith('/') and len(line.strip()) > 5],
-                        "urls": [line.strip() for line in lines if any(proto in line.lower() for proto in ['http://', 'https://', 'ftp://'])]
-                    }
-                    
-                    # Limit each category
-                    for key in parsed_data["sample_strings"]:
-                        parsed_data["sample_strings"][key] = parsed_data["sample_strings"][key][:10]
-            
-        except Exception as e:
-            parsed_data["parsing_error"] = str(e)
+            "sample_strings": (sample_interesting_strings, str(analysis_path / "quick_strings.txt")),
+        }
+        results = await asyncio.gather(
+            *(asyncio.to_thread(*parser) for parser in parsers.values()),
+            return_exceptions=True
+        )
+        
+        for key, result in zip(parsers, results):
+            if isinstance(result, Exception):
+                parsed_data.setdefault("parsing_error", str(result))
+            elif result is not None:
+                parsed_data[key] = result
         
         return parsed_data
     
@@ -191,26 +214,26 @@ class CustomForensicAnalyzer:
             Dict containing analysis summary
         """
         try:
-            if not os.path.exists(dump_file_path):
+            # Get basic file info
+            try:
+                st = os.stat(dump_file_path)
+            except FileNotFoundError:
+                self._summary_cache.pop(dump_file_path, None)
                 return {
                     "error": "Dump file not found",
                     "status": "failed"
                 }
+            file_size = st.st_size
+            signature = (st.st_mtime_ns, file_size)
             
-            # Get basic file info
-            file_stat = os.stat(dump_file_path)
-            file_size = file_stat.st_size
+            cached = self._summary_cache.get(dump_file_path)
+            if cached and cached[0] == signature:
+                return dict(cached[1])
             
             # Quick file type check
-            process = await asyncio.create_subprocess_exec(
-                "file", dump_file_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            file_type = stdout.decode().strip() if process.returncode == 0 else "Unknown"
+            file_type = await self._detect_file_type(dump_file_path)
             
-            return {
+            summary = {
                 "status": "ready",
                 "file_path": dump_file_path,
                 "file_size": file_size,
@@ -226,6 +249,9 @@ class CustomForensicAnalyzer:
                 ],
                 "estimated_analysis_time": self._estimate_analysis_time(file_size)
             }
+            self._summary_cache[dump_file_path] = (signature, summary)
+            
+            return dict(summary)
             
         except Exception as e:
             return {
@@ -233,24 +259,42 @@ class CustomForensicAnalyzer:
                 "status": "failed"
             }
     
+    async def _detect_file_type(self, dump_file_path: str) -> str:
+        """Describe a file from its magic bytes"""
+        if MAGIC_AVAILABLE:
+            try:
+                return await asyncio.to_thread(self._magic_from_file, dump_file_path)
+            except Exception:
+                return "Unknown"
+        
+        process = await asyncio.create_subprocess_exec(
+            "file", dump_file_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        return stdout.decode().strip() if process.returncode == 0 else "Unknown"
+    
+    def _magic_from_file(self, dump_file_path: str) -> str:
+        """Run libmagic on a file, loading its database on first use"""
+        with self._magic_lock:
+            if self._magic is None:
+                self._magic = magic.Magic()
+            return self._magic.from_file(dump_file_path)
+    
     def _human_readable_size(self, size_bytes: int) -> str:
         """Convert bytes to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        # Each unit is 10 bits; bit_length picks it exactly where math.log can round down
+        exp = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * exp)):.1f} {_SIZE_UNITS[exp]}"
+    
+    # Upper size bounds (exclusive) for each estimate tier; anything larger gets the last label
+    _TIME_THRESHOLDS = (100 * 1024 * 1024, 500 * 1024 * 1024, 1024 * 1024 * 1024)  # 100MB, 500MB, 1GB
+    _TIME_LABELS = ("1-2 minutes", "2-5 minutes", "5-10 minutes", "10-20 minutes")
     
     def _estimate_analysis_time(self, file_size: int) -> str:
         """Estimate analysis time based on file size"""
-        if file_size < 100 * 1024 * 1024:  # < 100MB
-            return "1-2 minutes"
-        elif file_size < 500 * 1024 * 1024:  # < 500MB
-            return "2-5 minutes"
-        elif file_size < 1024 * 1024 * 1024:  # < 1GB
-            return "5-10 minutes"
-        else:  # > 1GB
-            return "10-20 minutes"
+        return self._TIME_LABELS[bisect.bisect_right(self._TIME_THRESHOLDS, file_size)]
 
 # Example usage for testing
 async def main():
@@ -261,11 +305,11 @@ async def main():
     
     print("Getting analysis summary...")
     summary = await analyzer.get_analysis_summary(dump_file)
-    print(json.dumps(summary, indent=2))
+    print(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
     
     print("\nStarting full analysis...")
     results = await analyzer.analyze_memory_dump(dump_file)
-    print(json.dumps(results, indent=2))
+    print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,15 +4,25 @@ Provides automated memory dump analysis with progress tracking
 """
 
 import asyncio
+import hashlib
 import uuid
 import logging
 import re
-import json
+import mmap
 import os
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import shutil
+import time
+from sys import intern
+from collections import OrderedDict
+from contextlib import aclosing, suppress
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Optional, Dict, Any, Set, Tuple
 from pathlib import Path
 
+import aiohttp
+import ijson
+import orjson
+
 from ..models.forensic import (
     ForensicAnalysis, AnalysisStatus, AnalysisType, AnalysisResults,
     ProcessInfo, NetworkConnection, OpenFile, KernelModule, SystemInfo,
@@ -23,6 +33,193 @@ from ..models.dump import MemoryDump
 # Create logger for this module
 logger = logging.getLogger(__name__)
 
+# Banner parsing patterns, compiled once per process
+_LINUX_VERSION_RE = re.compile(r'Linux version (\S+)')
+_LINUX_KERNEL_RE = re.compile(r'Linux version (\d+\.\d+\.\d+-\d+-\w+)')
+_OS_DETECT_RE = re.compile(r'Linux version|Windows|KDBG|Darwin|Mac')
+# banners.Banners row mentioning a Linux banner: "<offset>  <banner text>"
+_BANNER_LINE_RE = re.compile(r'^(?=.*Linux version)[ \t]*(\S+)[ \t]+(\S.*?)[ \t\r]*$', re.MULTILINE)
+# Kernel banner as stored in memory, up to its terminating newline/NUL; the version
+# must start with digits so the "Linux version %s" format string doesn't match
+_BANNER_BYTES_RE = re.compile(rb'Linux version \d+\.\d+[^\s\x00]* [^\x00\n]{0,400}')
+_MAX_BANNERS = 100
+# Banner analyses memoized per dump file, kept in the dump's directory.
+# Not shared across dumps: a result is only reused for the exact same file
+_BANNER_CACHE_DIR = ".banner_cache"
+
+# Volatility plugin rows, matched one streamed line at a time.
+# Numeric columns only capture when the whole token is digits, otherwise they default to 0
+_PSLIST_ROW_RE = re.compile(
+    r'^[ \t]*(?P<pid>\d+)[ \t]+(?P<ppid>\d+)[ \t]+(?P<name>\S+)[ \t]+(?P<state>\S+)'
+    r'(?:[ \t]+(?:(?P<uid>\d+)(?!\S)|\S+))?(?:[ \t]+(?:(?P<gid>\d+)(?!\S)|\S+))?',
+    re.MULTILINE
+)
+_LSOF_ROW_RE = re.compile(
+    r'^[ \t]*(?P<pid>\d+)[ \t]+(?P<process>\S+)[ \t]+(?P<fd>\S+)[ \t]+(?P<file_type>\S+)'
+    r'(?:[ \t]+(?P<path>\S+))?',
+    re.MULTILINE
+)
+_LSMOD_ROW_RE = re.compile(
+    r'^(?!Offset|Volatility)[ \t]*(?P<offset>\S+)[ \t]+(?P<name>\S+)[ \t]+(?:(?P<size>\d+)(?!\S)|\S+)',
+    re.MULTILINE
+)
+_NETWORK_ROW_RE = re.compile(
+    r'^(?=[^\n]*?(?P<protocol>(?i:tcp|udp)))[ \t]*(?:(?P<pid>\d+)(?!\S)|\S+)'
+    r'[ \t]+(?P<local_addr>\S+?)(?::(?P<local_port>\d+))?(?!\S)'
+    r'[ \t]+(?P<remote_addr>\S+?)(?::(?P<remote_port>\d+))?(?!\S)'
+    r'(?:[ \t]+(?P<state>\S+))?',
+    re.MULTILINE
+)
+
+# Completed plugin outputs kept for reuse across analyses of the same dump
+_VOL_CACHE_SIZE = 32
+# Volatility processes allowed to run at once across all analyses
+_VOL_MAX_PARALLEL = 3
+# Longest Volatility output line read while streaming; asyncio's 64 KiB default is
+# too short for rows with long paths or bash history commands
+_VOL_LINE_LIMIT = 16 * 1024 * 1024
+
+# Note added to limited-mode results for each requested analysis type
+_ANALYSIS_NOTES: Dict[AnalysisType, str] = {
+    AnalysisType.PROCESSES: "❌ Process analysis: Requires full symbol table compatibility",
+    AnalysisType.NETWORK: "❌ Network analysis: Requires full symbol table compatibility",
+    AnalysisType.FILES: "❌ File analysis: Requires full symbol table compatibility",
+    AnalysisType.MODULES: "❌ Module analysis: Requires full symbol table compatibility",
+    AnalysisType.SYSTEM_INFO: "✅ System info: Basic information extracted from banners",
+    AnalysisType.BASH_HISTORY: "❌ Bash history: Requires full symbol table compatibility",
+}
+
+# Size of the ELF header block stripped when converting a dump to RAW
+_ELF_HEADER_SIZE = 4096
+
+
+def _kernel_copy_calls():
+    """In-kernel copy primitives, best first, each as (src_fd, dst_fd, offset, count) -> bytes copied"""
+    calls = []
+    if hasattr(os, "copy_file_range"):
+        # Can clone extents instead of copying on reflink filesystems (btrfs, XFS)
+        calls.append(lambda src_fd, dst_fd, offset, count: os.copy_file_range(src_fd, dst_fd, count, offset))
+    if hasattr(os, "sendfile"):
+        calls.append(lambda src_fd, dst_fd, offset, count: os.sendfile(dst_fd, src_fd, offset, count))
+    return tuple(calls)
+
+
+_KERNEL_COPY_CALLS = _kernel_copy_calls()
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """stat() a path, or None if it doesn't exist or can't be accessed"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _is_symbol_file(symbol_path: str) -> bool:
+    """Whether a file looks like a Volatility symbol table, parsing only up to its first symbol"""
+    with open(symbol_path, 'rb') as f:
+        try:
+            for prefix, event, _ in ijson.parse(f):
+                # First key inside the top-level "symbols" object
+                if prefix == 'symbols' and event == 'map_key':
+                    return True
+        except ijson.JSONError:
+            return False
+    return False
+
+
+def _scan_linux_banners(dump_file_path: str) -> List[Dict[str, str]]:
+    """Find Linux kernel banners by scanning the raw dump bytes through mmap"""
+    banners = []
+    with open(dump_file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _BANNER_BYTES_RE.finditer(mm):
+                banners.append({
+                    "offset": hex(match.start()),
+                    "text": match.group(0).decode('utf-8', errors='ignore').rstrip()
+                })
+                if len(banners) >= _MAX_BANNERS:
+                    break
+    return banners
+
+# Simboli importanti per Volatility, confrontati per nome esatto
+_SYSTEM_MAP_SYMBOLS = frozenset({'init_task', 'swapper_pg_dir', '_text', '_end', 'sys_call_table', 'init_mm'})
+
+
+def _load_cached_banners(dump_file_path: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Locate a dump file's banner memo entry and load it if present"""
+    # Keyed on the first 4 KiB plus size and mtime, which identifies this file rather
+    # than its kernel: guests often share a first page, and banner offsets differ per
+    # dump, so entries are deliberately never reused for a different dump
+    with open(dump_file_path, 'rb') as f:
+        key = hashlib.blake2b(f.read(4096), digest_size=16)
+        st = os.fstat(f.fileno())
+    key.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    cache_path = os.path.join(os.path.dirname(dump_file_path), _BANNER_CACHE_DIR, f"{key.hexdigest()}.json")
+    
+    try:
+        return cache_path, orjson.loads(Path(cache_path).read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return cache_path, None
+
+
+def _store_cached_banners(cache_path: str, banner_info: Dict[str, Any]) -> None:
+    """Write a dump's banner analysis to its cache entry"""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    Path(cache_path).write_bytes(orjson.dumps(banner_info))
+
+
+def _read_system_map_symbols(system_map: str) -> Dict[str, int]:
+    """Return the addresses of the Volatility key symbols listed in a System.map"""
+    symbols = {}
+    with open(system_map, 'r') as f:
+        for line in f:
+            # "<addr> <type> <name>"
+            parts = line.split(None, 2)
+            if len(parts) < 3:
+                continue
+            name = parts[2].rstrip()
+            if name in _SYSTEM_MAP_SYMBOLS:
+                try:
+                    symbols[name] = int(parts[0], 16)
+                except ValueError:
+                    continue
+    return symbols
+
+
+def _copy_from_offset(src_path: str, dst_path: str, offset: int) -> None:
+    """Copy src from offset to the end into dst, inside the kernel where possible"""
+    src_fd = os.open(src_path, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            remaining = max(os.fstat(src_fd).st_size - offset, 0)
+            # Both primitives append at dst's file position, so a partial copy can be resumed by the next one
+            for kernel_copy in _KERNEL_COPY_CALLS:
+                try:
+                    while remaining > 0:
+                        copied = kernel_copy(src_fd, dst_fd, offset, remaining)
+                        if copied == 0:
+                            break
+                        offset += copied
+                        remaining -= copied
+                    return
+                except OSError:
+                    # Not supported between these files (e.g. across filesystems on older kernels)
+                    continue
+            
+            # No in-kernel copy available; copy through userspace
+            os.lseek(src_fd, offset, os.SEEK_SET)
+            while True:
+                chunk = os.read(src_fd, 1024 * 1024)
+                if not chunk:
+                    break
+                os.write(dst_fd, chunk)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
 
 class ForensicAnalysisService:
     """Service for automated forensic analysis using Volatility"""
@@ -30,7 +227,23 @@ class ForensicAnalysisService:
     def __init__(self):
         self.analyses_db: Dict[str, ForensicAnalysis] = {}  # In-memory storage
         self.active_analyses: Dict[str, asyncio.Task] = {}
+        self._tombstones: Set[str] = set()  # Deleted analysis IDs, dropped by compact()
+        # analysis_id -> (status, progress, current_step, error_message), kept apart from the
+        # records so status polling never touches the (potentially large) results
+        self._progress: Dict[str, Tuple[AnalysisStatus, int, Optional[str], Optional[str]]] = {}
         self.volatility_path = "/home/stack/plugin1/project/volatility3-2.26.0"
+        # Set once `vol.py --help` has succeeded; a missing install keeps being rechecked
+        self._volatility_available = False
+        # kernel_version -> symbol lookup/generation run, shared by concurrent analyses
+        self._symbol_status: Dict[str, asyncio.Task] = {}
+        # (dump_id, plugin) -> output lines of completed Volatility runs, least recently used first
+        self._vol_cache: "OrderedDict[Tuple[str, str], Tuple[str, ...]]" = OrderedDict()
+        # Bounds concurrent Volatility processes; each can hold hundreds of MB while it runs
+        self._vol_slots = asyncio.Semaphore(_VOL_MAX_PARALLEL)
+        # Serializes installs of shared tooling (dwarf2json binary, apt packages) across kernels
+        self._tool_lock = asyncio.Lock()
+        # Symbol downloads share one connection pool instead of spawning wget per mirror
+        self._http: Optional[aiohttp.ClientSession] = None
         
         logger.info("ForensicAnalysisService initialized")
     
@@ -54,6 +267,7 @@ class ForensicAnalysisService:
         )
         
         self.analyses_db[analysis_id] = analysis
+        self._update_analysis(analysis)
         
         # Start analysis process asynchronously
         task = asyncio.create_task(
@@ -61,27 +275,31 @@ class ForensicAnalysisService:
         )
         self.active_analyses[analysis_id] = task
         
-        logger.info(f"Started forensic analysis {analysis_id} for dump {request.dump_id}")
+        logger.info("Started forensic analysis %s for dump %s", analysis_id, request.dump_id)
         return analysis_id
     
     async def _perform_analysis(self, analysis_id: str, analysis_types: List[AnalysisType]):
         """Perform LIMITED but WORKING forensic analysis"""
         analysis = self.analyses_db[analysis_id]
+        # Elapsed time comes from the monotonic clock; only started_at reads the wall clock
+        start_ns = time.monotonic_ns()
         
         try:
             # Update status to in progress
-            analysis.status = AnalysisStatus.IN_PROGRESS
             analysis.started_at = datetime.now()
-            analysis.progress = 5
-            analysis.current_step = "Starting limited forensic analysis..."
+            self._update_analysis(
+                analysis,
+                status=AnalysisStatus.IN_PROGRESS,
+                progress=5,
+                current_step="Starting limited forensic analysis..."
+            )
             
             # Check if Volatility is available
             if not await self._check_volatility_available():
                 raise Exception("Volatility 3 not found or not accessible")
             
             # STEP 1: Convert ELF to RAW if needed
-            analysis.current_step = "Converting dump format if needed..."
-            analysis.progress = 10
+            self._update_analysis(analysis, progress=10, current_step="Converting dump format if needed...")
             converted_dump_path = await self._convert_elf_to_raw_if_needed(analysis.dump.file_path)
             
             # Update dump path to converted version
@@ -89,15 +307,13 @@ class ForensicAnalysisService:
             analysis.dump.file_path = converted_dump_path
             
             # STEP 2: Extract basic information that WORKS
-            analysis.current_step = "Extracting basic system information..."
-            analysis.progress = 20
+            self._update_analysis(analysis, progress=20, current_step="Extracting basic system information...")
             
             # Initialize results with LIMITED but WORKING analysis
             results = AnalysisResults()
             
             # Banner analysis - QUESTO FUNZIONA!
-            analysis.current_step = "Analyzing system banners..."
-            analysis.progress = 30
+            self._update_analysis(analysis, progress=30, current_step="Analyzing system banners...")
             banner_info = await self._analyze_banners_simple(analysis)
             
             # Create basic system info from banners
@@ -116,8 +332,7 @@ class ForensicAnalysisService:
                 )
             
             # For now, leave other analysis types empty with explanatory notes
-            analysis.current_step = "Setting up limited analysis results..."
-            analysis.progress = 50
+            self._update_analysis(analysis, progress=50, current_step="Setting up limited analysis results...")
             
             # Set empty results with explanatory messages
             results.processes = []
@@ -127,20 +342,7 @@ class ForensicAnalysisService:
             results.bash_history = []
             
             # Add explanatory notes for each requested analysis type
-            notes = []
-            for analysis_type in analysis_types:
-                if analysis_type == AnalysisType.PROCESSES:
-                    notes.append("❌ Process analysis: Requires full symbol table compatibility")
-                elif analysis_type == AnalysisType.NETWORK:
-                    notes.append("❌ Network analysis: Requires full symbol table compatibility")
-                elif analysis_type == AnalysisType.FILES:
-                    notes.append("❌ File analysis: Requires full symbol table compatibility")
-                elif analysis_type == AnalysisType.MODULES:
-                    notes.append("❌ Module analysis: Requires full symbol table compatibility")
-                elif analysis_type == AnalysisType.SYSTEM_INFO:
-                    notes.append("✅ System info: Basic information extracted from banners")
-                elif analysis_type == AnalysisType.BASH_HISTORY:
-                    notes.append("❌ Bash history: Requires full symbol table compatibility")
+            notes = [_ANALYSIS_NOTES[analysis_type] for analysis_type in analysis_types]
             
             # Update system info with all notes
             if results.system_info:
@@ -156,30 +358,49 @@ class ForensicAnalysisService:
             
             # Finalize analysis
             analysis.results = results
-            analysis.status = AnalysisStatus.COMPLETED
-            analysis.completed_at = datetime.now()
-            analysis.progress = 100
-            analysis.current_step = "Limited analysis completed"
+            elapsed_ns = time.monotonic_ns() - start_ns
+            # Derived from started_at so an NTP step mid-analysis can't put it before the start
+            analysis.completed_at = analysis.started_at + timedelta(microseconds=elapsed_ns // 1000)
+            self._update_analysis(
+                analysis,
+                status=AnalysisStatus.COMPLETED,
+                progress=100,
+                current_step="Limited analysis completed"
+            )
             
-            logger.info(f"Limited forensic analysis {analysis_id} completed successfully")
+            logger.info("Limited forensic analysis %s completed successfully in %.1fs", analysis_id, elapsed_ns / 1e9)
             
         except Exception as e:
-            analysis.status = AnalysisStatus.FAILED
-            analysis.error_message = str(e)
-            analysis.progress = 0
-            analysis.current_step = f"Failed: {str(e)}"
-            logger.error(f"Forensic analysis {analysis_id} failed: {e}")
+            self._update_analysis(
+                analysis,
+                status=AnalysisStatus.FAILED,
+                progress=0,
+                current_step=f"Failed: {str(e)}",
+                error_message=str(e)
+            )
+            logger.error("Forensic analysis %s failed after %.1fs: %s", analysis_id, (time.monotonic_ns() - start_ns) / 1e9, e)
         finally:
             # Remove from active analyses
             if analysis_id in self.active_analyses:
                 del self.active_analyses[analysis_id]
     
+    def _update_analysis(self, analysis: ForensicAnalysis, **fields):
+        """Set progress fields on an analysis and mirror them into the status index"""
+        for name, value in fields.items():
+            setattr(analysis, name, value)
+        self._progress[analysis.id] = (
+            analysis.status, analysis.progress, analysis.current_step, analysis.error_message
+        )
+    
     async def _convert_elf_to_raw_if_needed(self, dump_file_path: str) -> str:
         """Convert ELF dump to RAW format for better Volatility compatibility"""
         try:
-            # Check if it's an ELF file
-            with open(dump_file_path, 'rb') as f:
-                magic = f.read(4)
+            # Check if it's an ELF file (raw fd, no buffered reader for 4 bytes)
+            fd = os.open(dump_file_path, os.O_RDONLY)
+            try:
+                magic = os.pread(fd, 4, 0)
+            finally:
+                os.close(fd)
             
             if magic == b'\x7fELF':
                 logger.info("ELF dump detected, converting to RAW...")
@@ -187,148 +408,206 @@ class ForensicAnalysisService:
                 if '.dump' not in dump_file_path:
                     raw_file_path = dump_file_path + '_converted.raw'
                 
-                # Convert using dd: skip 4KB header, take the rest
-                cmd = f"dd if={dump_file_path} of={raw_file_path} bs=4096 skip=1 2>/dev/null"
-                process = await asyncio.create_subprocess_shell(
-                    cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                await process.communicate()
-                
-                if os.path.exists(raw_file_path):
-                    logger.info(f"ELF converted to RAW: {raw_file_path}")
-                    return raw_file_path
-                else:
-                    logger.warning("ELF conversion failed, using original")
+                # Skip the 4KB header, take the rest
+                try:
+                    await asyncio.to_thread(_copy_from_offset, dump_file_path, raw_file_path, _ELF_HEADER_SIZE)
+                except OSError as e:
+                    logger.warning("ELF conversion failed (%s), using original", e)
                     return dump_file_path
+                
+                logger.info("ELF converted to RAW: %s", raw_file_path)
+                return raw_file_path
             else:
                 logger.info("Non-ELF dump, using as-is")
                 return dump_file_path
                 
         except Exception as e:
-            logger.error(f"Error in ELF conversion: {e}")
+            logger.error("Error in ELF conversion: %s", e)
             return dump_file_path
     
     async def _analyze_banners_simple(self, analysis: ForensicAnalysis) -> dict:
         """Extract banner information - this WORKS with our setup"""
         try:
-            # Use banners plugin which works without full symbol tables
-            cmd = f"cd {self.volatility_path} && python3 vol.py -f {analysis.dump.file_path} banners.Banners"
-            
-            process = await asyncio.create_subprocess_shell(
-                cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                logger.warning(f"Banner analysis failed: {stderr.decode()}")
-                return {"kernel_version": "unknown", "banners": [], "total_banners": 0}
-            
-            output = stdout.decode('utf-8', errors='ignore')
-            banners = []
-            lines = output.split('\n')
-            
-            for line in lines:
-                if line.strip() and 'Linux version' in line:
-                    # Parse banner line: "0x7800200    Linux version..."
-                    parts = line.strip().split(None, 1)
-                    if len(parts) >= 2:
-                        offset = parts[0]
-                        banner_text = parts[1]
-                        banners.append({
-                            "offset": offset,
-                            "text": banner_text
-                        })
+            # Re-analysing an unchanged dump reuses the banners found last time
+            try:
+                cache_path, cached = await asyncio.to_thread(_load_cached_banners, analysis.dump.file_path)
+            except OSError as e:
+                logger.debug("Banner cache unavailable: %s", e)
+                cache_path, cached = None, None
+            if cached:
+                return cached
+            
+            # Banners are plain ASCII in the dump, so scan it directly before paying for Volatility
+            try:
+                banners = await asyncio.to_thread(_scan_linux_banners, analysis.dump.file_path)
+            except (OSError, ValueError) as e:
+                logger.warning("Direct banner scan failed: %s", e)
+                banners = []
+            
+            if not banners:
+                # Use banners plugin which works without full symbol tables
+                async with self._vol_slots:
+                    process = await asyncio.create_subprocess_exec(
+                        'python3', 'vol.py', '-f', analysis.dump.file_path, 'banners.Banners',
+                        cwd=self.volatility_path,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        limit=_VOL_LINE_LIMIT
+                    )
+                    stderr_task = asyncio.create_task(process.stderr.read())
+                    
+                    # Parse banner lines as they're printed: "0x7800200    Linux version..."
+                    async for raw_line in process.stdout:
+                        if b'Linux version' not in raw_line:
+                            continue
+                        match = _BANNER_LINE_RE.match(raw_line.decode('utf-8', errors='ignore'))
+                        if match:
+                            banners.append({"offset": match.group(1), "text": match.group(2)})
+                    stderr = await stderr_task
+                    await process.wait()
+                
+                if process.returncode != 0:
+                    logger.warning("Banner analysis failed: %s", stderr.decode())
+                    return {"kernel_version": "unknown", "banners": [], "total_banners": 0}
             
             if banners:
                 # Extract kernel version from first banner
                 first_banner = banners[0]["text"]
-                kernel_match = re.search(r'Linux version ([^\s]+)', first_banner)
+                kernel_match = _LINUX_VERSION_RE.search(first_banner)
                 kernel_version = kernel_match.group(1) if kernel_match else "unknown"
                 
-                return {
+                banner_info = {
                     "kernel_version": kernel_version,
                     "banners": banners,
                     "total_banners": len(banners)
                 }
+                if cache_path:
+                    try:
+                        await asyncio.to_thread(_store_cached_banners, cache_path, banner_info)
+                    except OSError as e:
+                        logger.debug("Could not cache banners: %s", e)
+                return banner_info
             else:
                 return {"kernel_version": "unknown", "banners": [], "total_banners": 0}
                 
         except Exception as e:
-            logger.error(f"Error analyzing banners: {e}")
+            logger.error("Error analyzing banners: %s", e)
             return {"kernel_version": "unknown", "banners": [], "total_banners": 0}
     
     async def _check_volatility_available(self) -> bool:
         """Check if Volatility 3 is available"""
+        if self._volatility_available:
+            return True
+        
         try:
             vol_script = Path(self.volatility_path) / "vol.py"
             if not vol_script.exists():
-                logger.error(f"Volatility script not found at {vol_script}")
+                logger.error("Volatility script not found at %s", vol_script)
                 return False
             
             # Test Volatility
-            process = await asyncio.create_subprocess_shell(
-                f"cd {self.volatility_path} && python3 vol.py --help",
+            process = await asyncio.create_subprocess_exec(
+                'python3', 'vol.py', '--help',
+                cwd=self.volatility_path,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
             stdout, stderr = await process.communicate()
             
-            return process.returncode == 0
+            self._volatility_available = process.returncode == 0
+            return self._volatility_available
             
         except Exception as e:
-            logger.error(f"Error checking Volatility availability: {e}")
+            logger.error("Error checking Volatility availability: %s", e)
             return False
     
-    async def _run_volatility_command(self, analysis: ForensicAnalysis, plugin: str) -> str:
-        """Run a Volatility command and return output"""
-        cmd = f"cd {analysis.volatility_path} && python3 vol.py -f {analysis.dump_file_path} {plugin}"
-        
-        logger.debug(f"Running Volatility command: {plugin}")
+    async def _iter_volatility_lines(self, analysis: ForensicAnalysis, plugin: str) -> AsyncIterator[str]:
+        """Run a Volatility command and yield its output one line at a time as it's printed"""
+        # Plugins are deterministic for a given dump, so a completed run is reused
+        cache_key = (analysis.dump_id, plugin)
+        cached = self._vol_cache.get(cache_key)
+        if cached is not None:
+            self._vol_cache.move_to_end(cache_key)
+            for line in cached:
+                yield line
+            return
         
-        process = await asyncio.create_subprocess_shell(
-            cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+        logger.debug("Running Volatility command: %s", plugin)
         
-        stdout, stderr = await process.communicate()
+        async with self._vol_slots:
+            process = await asyncio.create_subprocess_exec(
+                'python3', 'vol.py', '-f', analysis.dump_file_path, plugin,
+                cwd=analysis.volatility_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=_VOL_LINE_LIMIT
+            )
+            # Drain stderr alongside stdout so a chatty plugin can't fill the pipe and stall
+            stderr_task = asyncio.create_task(process.stderr.read())
+            
+            output_lines = []
+            finished = False
+            try:
+                async for raw_line in process.stdout:
+                    line = raw_line.decode(errors='replace').rstrip('\r\n')
+                    output_lines.append(line)
+                    yield line
+                stderr = await stderr_task
+                await process.wait()
+                finished = True
+            finally:
+                # The caller stopped early (or was cancelled): don't leave vol.py running
+                if not finished:
+                    stderr_task.cancel()
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
         
         if process.returncode != 0:
             error_msg = stderr.decode() if stderr else "Unknown error"
             raise Exception(f"Volatility command failed: {error_msg}")
         
-        return stdout.decode()
+        self._vol_cache[cache_key] = tuple(output_lines)
+        if len(self._vol_cache) > _VOL_CACHE_SIZE:
+            self._vol_cache.popitem(last=False)
+    
+    def forget_dump(self, dump_id: str):
+        """Drop cached Volatility output for a deleted dump"""
+        for key in [key for key in self._vol_cache if key[0] == dump_id]:
+            del self._vol_cache[key]
+    
+    async def _run_volatility_command(self, analysis: ForensicAnalysis, plugin: str) -> str:
+        """Run a Volatility command and return output"""
+        return "\n".join([line async for line in self._iter_volatility_lines(analysis, plugin)])
     
     async def _identify_os_type(self, analysis: ForensicAnalysis) -> str:
         """Identify the operating system type and kernel version using banners"""
         try:
-            logger.info(f"Identifying OS type and kernel for {analysis.id}")
+            logger.info("Identifying OS type and kernel for %s", analysis.id)
             output = await self._run_volatility_command(analysis, "banners.Banners")
             
             # Analizza l'output per determinare il tipo di OS e versione kernel
             kernel_version = None
             os_type = None
             
-            for line in output.split('\n'):
+            # La prima occorrenza di una firma individua la riga da esaminare
+            os_match = _OS_DETECT_RE.search(output)
+            if os_match:
+                line_start = output.rfind('\n', 0, os_match.start()) + 1
+                line_end = output.find('\n', os_match.end())
+                line = output[line_start:line_end if line_end != -1 else len(output)]
+                
                 if "Linux version" in line:
                     os_type = "linux"
                     # Estrai versione kernel (es: 5.15.0-117-generic)
-                    import re
-                    kernel_match = re.search(r'Linux version (\d+\.\d+\.\d+-\d+-\w+)', line)
+                    kernel_match = _LINUX_KERNEL_RE.search(line)
                     if kernel_match:
                         kernel_version = kernel_match.group(1)
-                        logger.info(f"Detected Linux kernel: {kernel_version}")
-                    break
+                        logger.info("Detected Linux kernel: %s", kernel_version)
                 elif "Windows" in line or "KDBG" in line:
                     os_type = "windows"
-                    break
-                elif "Darwin" in line or "Mac" in line:
+                else:
                     os_type = "mac"
-                    break
             
             if os_type == "linux" and kernel_version:
                 # Verifica e setup simboli per questo kernel
@@ -336,27 +615,42 @@ class ForensicAnalysisService:
                 analysis.kernel_version = kernel_version
             
             if os_type:
-                logger.info(f"OS detected: {os_type}")
+                logger.info("OS detected: %s", os_type)
                 return os_type
             else:
-                logger.warning(f"Unknown OS type from banners: {output[:200]}")
+                logger.warning("Unknown OS type from banners: %s", output[:200])
                 return "linux"  # Default per DevStack
                 
         except Exception as e:
-            logger.warning(f"Failed to identify OS type: {e}")
+            logger.warning("Failed to identify OS type: %s", e)
             return "linux"  # Default per DevStack
     
     async def _ensure_linux_symbols(self, kernel_version: str) -> bool:
         """Ensure Linux kernel symbols are available for the detected kernel"""
+        # Single-flight per kernel: later and concurrent callers await the same run
+        task = self._symbol_status.get(kernel_version)
+        if task is None:
+            task = asyncio.create_task(self._resolve_linux_symbols(kernel_version))
+            self._symbol_status[kernel_version] = task
+        
+        # Shielded so one cancelled analysis doesn't abort generation for the others
+        available = await asyncio.shield(task)
+        if not available and self._symbol_status.get(kernel_version) is task:
+            # Failures may be transient (downloads, apt), let the next analysis retry
+            del self._symbol_status[kernel_version]
+        return available
+    
+    async def _resolve_linux_symbols(self, kernel_version: str) -> bool:
+        """Find or generate the symbol table for a kernel"""
         try:
             symbol_path = f"{self.volatility_path}/volatility3/symbols/linux/linux-{kernel_version}.json"
             
             # Verifica se i simboli esistono già
             if os.path.exists(symbol_path):
-                logger.info(f"Symbols already exist for kernel {kernel_version}")
+                logger.info("Symbols already exist for kernel %s", kernel_version)
                 return True
             
-            logger.info(f"Symbols not found for kernel {kernel_version}, attempting to generate...")
+            logger.info("Symbols not found for kernel %s, attempting to generate...", kernel_version)
             
             # Crea directory simboli se non esiste
             symbol_dir = f"{self.volatility_path}/volatility3/symbols/linux"
@@ -366,13 +660,13 @@ class ForensicAnalysisService:
             return await self._generate_linux_symbols(kernel_version, symbol_path)
             
         except Exception as e:
-            logger.error(f"Failed to ensure Linux symbols: {e}")
+            logger.error("Failed to ensure Linux symbols: %s", e)
             return False
     
     async def _generate_linux_symbols(self, kernel_version: str, symbol_path: str) -> bool:
         """Generate Linux kernel symbols using ALL available methods - FULLY AUTOMATIC"""
         try:
-            logger.info(f"🔧 Starting AUTOMATIC symbol generation for {kernel_version}")
+            logger.info("🔧 Starting AUTOMATIC symbol generation for %s", kernel_version)
             
             # Strategia 1: dwarf2json con vmlinux detection intelligente
             if await self._try_dwarf2json_method(kernel_version, symbol_path):
@@ -394,11 +688,11 @@ class ForensicAnalysisService:
             if await self._create_minimal_symbols(kernel_version, symbol_path):
                 return True
             
-            logger.error(f"❌ ALL symbol generation methods failed for {kernel_version}")
+            logger.error("❌ ALL symbol generation methods failed for %s", kernel_version)
             return False
             
         except Exception as e:
-            logger.error(f"Error in automatic symbol generation: {e}")
+            logger.error("Error in automatic symbol generation: %s", e)
             return False
     
     async def _try_dwarf2json_method(self, kernel_version: str, symbol_path: str) -> bool:
@@ -408,15 +702,20 @@ class ForensicAnalysisService:
             
             dwarf_path = f"{self.volatility_path}/dwarf2json"
             
-            # Download dwarf2json se non presente
-            if not os.path.exists(dwarf_path):
-                logger.info("📥 Downloading dwarf2json...")
-                process = await asyncio.create_subprocess_shell(
-                    f"cd {self.volatility_path} && wget -q https://github.com/volatilityfoundation/dwarf2json/releases/download/v0.8.0/dwarf2json-linux-amd64 -O dwarf2json && chmod +x dwarf2json",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                await process.communicate()
+            # Download dwarf2json se non presente; il lock evita che un'altra versione del
+            # kernel esegua il binario mentre è ancora in scaricamento
+            async with self._tool_lock:
+                if not os.path.exists(dwarf_path):
+                    logger.info("📥 Downloading dwarf2json...")
+                    process = await asyncio.create_subprocess_exec(
+                        'wget', '-q', 'https://github.com/volatilityfoundation/dwarf2json/releases/download/v0.8.0/dwarf2json-linux-amd64', '-O', 'dwarf2json',
+                        cwd=self.volatility_path,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE
+                    )
+                    await process.communicate()
+                    if process.returncode == 0:
+                        os.chmod(dwarf_path, 0o755)
             
             # Cerca vmlinux in tutte le posizioni possibili
             vmlinux_paths = [
@@ -432,15 +731,14 @@ class ForensicAnalysisService:
             for path in vmlinux_paths:
                 if os.path.exists(path):
                     vmlinux_found = path
-                    logger.info(f"✅ Found vmlinux: {path}")
+                    logger.info("✅ Found vmlinux: %s", path)
                     break
             
             if vmlinux_found and os.path.exists(dwarf_path):
-                logger.info(f"⚙️ Generating symbols with dwarf2json...")
-                cmd = f"cd {self.volatility_path} && timeout 300 sudo ./dwarf2json linux --elf {vmlinux_found}"
-                
-                process = await asyncio.create_subprocess_shell(
-                    cmd,
+                logger.info("⚙️ Generating symbols with dwarf2json...")
+                process = await asyncio.create_subprocess_exec(
+                    'timeout', '300', 'sudo', './dwarf2json', 'linux', '--elf', vmlinux_found,
+                    cwd=self.volatility_path,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE
                 )
@@ -450,16 +748,15 @@ class ForensicAnalysisService:
                     with open(symbol_path, 'wb') as f:
                         f.write(stdout)
                     
-                    file_size = os.path.getsize(symbol_path)
-                    logger.info(f"✅ Generated symbols with dwarf2json ({file_size} bytes)")
+                    logger.info("✅ Generated symbols with dwarf2json (%s bytes)", len(stdout))
                     return True
                 else:
-                    logger.warning(f"dwarf2json failed: {stderr.decode() if stderr else 'No output'}")
+                    logger.warning("dwarf2json failed: %s", stderr.decode() if stderr else 'No output')
             
             return False
             
         except Exception as e:
-            logger.error(f"dwarf2json method failed: {e}")
+            logger.error("dwarf2json method failed: %s", e)
             return False
     
     async def _try_precompiled_download(self, kernel_version: str, symbol_path: str) -> bool:
@@ -467,55 +764,149 @@ class ForensicAnalysisService:
         try:
             logger.info("📥 Trying precompiled symbol download...")
             
-            symbol_dir = os.path.dirname(symbol_path)
-            
-            # Lista URL di repository simboli
-            download_commands = [
-                f"cd {symbol_dir} && wget -q --timeout=30 https://downloads.volatilityfoundation.org/volatility3/symbols/linux.zip && unzip -q linux.zip",
-                f"cd {symbol_dir} && wget -q --timeout=30 https://github.com/volatilityfoundation/volatility3/raw/stable/volatility3/symbols/linux/linux-{kernel_version}.json -O linux-{kernel_version}.json",
-                f"cd {symbol_dir} && wget -q --timeout=30 https://symbols.ubuntu.com/volatility/linux-{kernel_version}.json -O linux-{kernel_version}.json"
-            ]
-            
-            for cmd in download_commands:
-                try:
-                    process = await asyncio.create_subprocess_shell(
-                        cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    await process.communicate()
-                    
-                    # Verifica se il file è stato scaricato correttamente
-                    if os.path.exists(symbol_path) and os.path.getsize(symbol_path) > 100:
-                        # Verifica che sia JSON valido
-                        try:
-                            import json
-                            with open(symbol_path, 'r') as f:
-                                data = json.load(f)
-                                if 'symbols' in data:
-                                    logger.info(f"✅ Downloaded precompiled symbols ({len(data['symbols'])} symbols)")
-                                    return True
-                        except json.JSONDecodeError:
-                            # File non valido, rimuovi e prova il prossimo
-                            os.remove(symbol_path)
-                except Exception as e:
-                    logger.debug(f"Download attempt failed: {e}")
-                    continue
-            
-            # Cerca simboli compatibili già scaricati
-            for file in os.listdir(symbol_dir):
-                if file.endswith('.json') and kernel_version.split('-')[0] in file:
-                    compatible_path = os.path.join(symbol_dir, file)
-                    import shutil
-                    shutil.copy2(compatible_path, symbol_path)
-                    logger.info(f"✅ Found compatible symbol file: {file}")
-                    return True
-            
-            return False
+            # Dal più economico al più costoso: disco locale, mirror remoti, file compatibili
+            if await self._local_existing(symbol_path):
+                return True
+            if await self._remote_race(kernel_version, symbol_path):
+                return True
+            return await self._local_compatible_copy(kernel_version, symbol_path)
             
         except Exception as e:
-            logger.error(f"Precompiled download failed: {e}")
+            logger.error("Precompiled download failed: %s", e)
+            return False
+    
+    async def _local_existing(self, symbol_path: str) -> bool:
+        """Check for a valid symbol file already at the target path"""
+        symbol_stat = _stat_or_none(symbol_path)
+        if not symbol_stat or symbol_stat.st_size <= 100:
+            return False
+        if not await asyncio.to_thread(_is_symbol_file, symbol_path):
+            return False
+        logger.info("✅ Using existing symbol file: %s", os.path.basename(symbol_path))
+        return True
+    
+    async def _remote_race(self, kernel_version: str, symbol_path: str) -> bool:
+        """Download from every mirror at once, keeping the first valid symbol file"""
+        symbol_dir = os.path.dirname(symbol_path)
+        
+        # Lista URL di repository simboli; ogni tentativo scarica in un file proprio,
+        # così i mirror possono essere provati in parallelo
+        download_attempts = [
+            (
+                'https://downloads.volatilityfoundation.org/volatility3/symbols/linux.zip',
+                os.path.join(symbol_dir, "linux.zip"),
+                symbol_path,
+            ),
+            (
+                f'https://github.com/volatilityfoundation/volatility3/raw/stable/volatility3/symbols/linux/linux-{kernel_version}.json',
+                os.path.join(symbol_dir, f"linux-{kernel_version}.try1.json"),
+                os.path.join(symbol_dir, f"linux-{kernel_version}.try1.json"),
+            ),
+            (
+                f'https://symbols.ubuntu.com/volatility/linux-{kernel_version}.json',
+                os.path.join(symbol_dir, f"linux-{kernel_version}.try2.json"),
+                os.path.join(symbol_dir, f"linux-{kernel_version}.try2.json"),
+            ),
+        ]
+        
+        # Il primo download valido vince, gli altri vengono annullati
+        pending = {
+            asyncio.create_task(self._download_symbols(url, download_path, candidate_path))
+            for url, download_path, candidate_path in download_attempts
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception():
+                        logger.debug("Download attempt failed: %s", task.exception())
+                        continue
+                    candidate_path = task.result()
+                    if candidate_path:
+                        os.replace(candidate_path, symbol_path)
+                        logger.info("✅ Downloaded precompiled symbols (%s)", os.path.basename(candidate_path))
+                        return True
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for _, download_path, _ in download_attempts:
+                with suppress(FileNotFoundError):
+                    os.remove(download_path)
+        
+        return False
+    
+    async def _local_compatible_copy(self, kernel_version: str, symbol_path: str) -> bool:
+        """Copy an already-downloaded symbol file for the same base kernel version"""
+        # Cerca simboli compatibili già scaricati, in un solo passaggio sulla directory
+        base_version = kernel_version.split('-')[0]
+        with os.scandir(os.path.dirname(symbol_path)) as entries:
+            compatible = next(
+                (e for e in entries if e.name.endswith('.json') and base_version in e.name and e.is_file()),
+                None
+            )
+        if compatible is None:
             return False
+        
+        await asyncio.to_thread(shutil.copy2, compatible.path, symbol_path)
+        logger.info("✅ Found compatible symbol file: %s", compatible.name)
+        return True
+    
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Shared HTTP session for symbol downloads, created on first use"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._http
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+    
+    async def _download_symbols(
+        self, url: str, download_path: str, candidate_path: str
+    ) -> Optional[str]:
+        """Run one download attempt and validate the symbol file it produced"""
+        async with self._get_http_session().get(url) as response:
+            if response.status != 200:
+                return None
+            # Streamed straight to disk, the zip archive is never held in memory
+            with open(download_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(65536):
+                    f.write(chunk)
+        
+        if download_path.endswith('.zip'):
+            process = await asyncio.create_subprocess_exec(
+                'unzip', '-q', '-o', download_path,
+                cwd=os.path.dirname(download_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                await process.communicate()
+            except asyncio.CancelledError:
+                # Another mirror won the race
+                process.kill()
+                await process.wait()
+                raise
+            if process.returncode != 0:
+                return None
+        
+        # Verifica se il file è stato scaricato correttamente
+        symbol_stat = _stat_or_none(candidate_path)
+        if not symbol_stat or symbol_stat.st_size <= 100:
+            return None
+        
+        # Verifica che sia JSON valido
+        if not await asyncio.to_thread(_is_symbol_file, candidate_path):
+            # File non valido, rimuovi e prova il prossimo
+            os.remove(candidate_path)
+            return None
+        return candidate_path
     
     async def _try_system_map_method(self, kernel_version: str, symbol_path: str) -> bool:
         """Generate symbols from System.map"""
@@ -526,21 +917,8 @@ class ForensicAnalysisService:
             
             logger.info("🗺️ Generating symbols from System.map...")
             
-            import json
-            symbols = {}
-            
             # Leggi System.map e estrai simboli importanti
-            with open(system_map, 'r') as f:
-                for line in f:
-                    parts = line.strip().split()
-                    if len(parts) >= 3:
-                        addr, sym_type, name = parts[0], parts[1], parts[2]
-                        # Prendi solo simboli importanti per Volatility
-                        if any(keyword in name for keyword in ['init_task', 'swapper_pg_dir', '_text', '_end', 'sys_call_table', 'init_mm']):
-                            try:
-                                symbols[name] = int(addr, 16)
-                            except ValueError:
-                                continue
+            symbols = await asyncio.to_thread(_read_system_map_symbols, system_map)
             
             if len(symbols) > 5:  # Assicurati di avere simboli sufficienti
                 symbol_data = {
@@ -555,16 +933,15 @@ class ForensicAnalysisService:
                     "base_types": {}
                 }
                 
-                with open(symbol_path, 'w') as f:
-                    json.dump(symbol_data, f, indent=2)
+                Path(symbol_path).write_bytes(orjson.dumps(symbol_data))
                 
-                logger.info(f"✅ Generated symbols from System.map ({len(symbols)} symbols)")
+                logger.info("✅ Generated symbols from System.map (%s symbols)", len(symbols))
                 return True
             
             return False
             
         except Exception as e:
-            logger.error(f"System.map method failed: {e}")
+            logger.error("System.map method failed: %s", e)
             return False
     
     async def _try_debug_symbol_install(self, kernel_version: str, symbol_path: str) -> bool:
@@ -574,32 +951,34 @@ class ForensicAnalysisService:
             
             # Prova installazione debug symbols
             install_cmds = [
-                "sudo apt update",
-                f"sudo apt install -y linux-image-{kernel_version}-dbgsym",
-                f"sudo apt install -y linux-headers-{kernel_version}",
-                "sudo apt install -y dwarfdump binutils-dev"
+                ['sudo', 'apt', 'update'],
+                ['sudo', 'apt', 'install', '-y', f'linux-image-{kernel_version}-dbgsym'],
+                ['sudo', 'apt', 'install', '-y', f'linux-headers-{kernel_version}'],
+                ['sudo', 'apt', 'install', '-y', 'dwarfdump', 'binutils-dev']
             ]
             
-            for cmd in install_cmds:
-                try:
-                    process = await asyncio.create_subprocess_shell(
-                        cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    await asyncio.wait_for(process.communicate(), timeout=120)
-                except asyncio.TimeoutError:
-                    logger.warning(f"Command timed out: {cmd}")
-                    continue
-                except Exception as e:
-                    logger.debug(f"Install command failed: {e}")
-                    continue
+            # apt/dpkg hold a system-wide lock: installs for different kernels run one at a time
+            async with self._tool_lock:
+                for cmd in install_cmds:
+                    try:
+                        process = await asyncio.create_subprocess_exec(
+                            *cmd,
+                            stdout=asyncio.subprocess.PIPE,
+                            stderr=asyncio.subprocess.PIPE
+                        )
+                        await asyncio.wait_for(process.communicate(), timeout=120)
+                    except asyncio.TimeoutError:
+                        logger.warning("Command timed out: %s", ' '.join(cmd))
+                        continue
+                    except Exception as e:
+                        logger.debug("Install command failed: %s", e)
+                        continue
             
             # Retry dwarf2json dopo installazione
             return await self._try_dwarf2json_method(kernel_version, symbol_path)
             
         except Exception as e:
-            logger.error(f"Debug symbol installation failed: {e}")
+            logger.error("Debug symbol installation failed: %s", e)
             return False
     
     async def _create_minimal_symbols(self, kernel_version: str, symbol_path: str) -> bool:
@@ -640,49 +1019,39 @@ class ForensicAnalysisService:
                 }
             }
             
-            import json
-            with open(symbol_path, 'w') as f:
-                json.dump(minimal_symbols, f, indent=2)
+            Path(symbol_path).write_bytes(orjson.dumps(minimal_symbols))
             
             logger.info("✅ Created minimal symbol set (basic process listing may work)")
             return True
             
         except Exception as e:
-            logger.error(f"Minimal symbol creation failed: {e}")
+            logger.error("Minimal symbol creation failed: %s", e)
             return False
     
     async def _analyze_processes(self, analysis: ForensicAnalysis) -> List[ProcessInfo]:
         """Analyze running processes"""
         try:
-            output = await self._run_volatility_command(analysis, "linux.pslist.PsList")
-            processes = []
-            
-            # Parse pslist output
-            lines = output.split('\n')
-            for line in lines:
-                if line.strip() and not line.startswith('PID') and not line.startswith('Volatility'):
-                    # Parse process line (format may vary)
-                    parts = line.strip().split()
-                    if len(parts) >= 4:
-                        try:
-                            process = ProcessInfo(
-                                pid=int(parts[0]),
-                                ppid=int(parts[1]) if len(parts) > 1 else 0,
-                                name=parts[2] if len(parts) > 2 else "unknown",
-                                state=parts[3] if len(parts) > 3 else "unknown",
-                                uid=int(parts[4]) if len(parts) > 4 and parts[4].isdigit() else 0,
-                                gid=int(parts[5]) if len(parts) > 5 and parts[5].isdigit() else 0
-                            )
-                            processes.append(process)
-                        except (ValueError, IndexError):
-                            # Skip malformed lines
-                            continue
+            # Parse pslist output as the plugin prints it; headers and malformed rows don't match.
+            # Values are already converted here, so skip pydantic re-validation.
+            # Low-cardinality columns are interned so repeated values share one string
+            processes = [
+                ProcessInfo.model_construct(
+                    pid=int(match.group('pid')),
+                    ppid=int(match.group('ppid')),
+                    name=match.group('name'),
+                    state=intern(match.group('state')),
+                    uid=int(match.group('uid') or 0),
+                    gid=int(match.group('gid') or 0)
+                )
+                async for line in self._iter_volatility_lines(analysis, "linux.pslist.PsList")
+                if (match := _PSLIST_ROW_RE.match(line))
+            ]
             
-            logger.info(f"Found {len(processes)} processes")
+            logger.info("Found %s processes", len(processes))
             return processes
             
         except Exception as e:
-            logger.error(f"Process analysis failed: {e}")
+            logger.error("Process analysis failed: %s", e)
             return []
     
     async def _analyze_network(self, analysis: ForensicAnalysis) -> List[NetworkConnection]:
@@ -690,204 +1059,186 @@ class ForensicAnalysisService:
         try:
             # Try sockstat first, fallback to lsof if needed
             try:
-                output = await self._run_volatility_command(analysis, "linux.sockstat.Sockstat")
+                connections = await self._read_network_rows(analysis, "linux.sockstat.Sockstat")
             except:
                 logger.warning("sockstat.Sockstat failed, trying lsof for network info")
-                output = await self._run_volatility_command(analysis, "linux.lsof.Lsof")
-            
-            connections = []
-            lines = output.split('\n')
+                connections = await self._read_network_rows(analysis, "linux.lsof.Lsof")
             
-            # Parse network output - this will need adjustment based on actual format
-            for line in lines:
-                if line.strip() and 'tcp' in line.lower() or 'udp' in line.lower():
-                    try:
-                        # Basic parsing - adjust based on actual output format
-                        parts = line.strip().split()
-                        if len(parts) >= 3:
-                            connection = NetworkConnection(
-                                local_addr=parts[1] if len(parts) > 1 else "unknown",
-                                remote_addr=parts[2] if len(parts) > 2 else "unknown",
-                                state=parts[3] if len(parts) > 3 else "unknown",
-                                pid=int(parts[0]) if len(parts) > 0 and parts[0].isdigit() else 0
-                            )
-                            connections.append(connection)
-                    except (ValueError, IndexError):
-                        continue
-            
-            logger.info(f"Found {len(connections)} network connections")
+            logger.info("Found %s network connections", len(connections))
             return connections
             
         except Exception as e:
-            logger.error(f"Network analysis failed: {e}")
-            return []
-            for line in lines:
-                if line.strip() and ':' in line and not line.startswith('Volatility'):
-                    # Parse network connection line
-                    parts = line.strip().split()
-                    if len(parts) >= 4:
-                        try:
-                            # Extract addresses and ports
-                            local_part = parts[1] if len(parts) > 1 else ""
-                            remote_part = parts[2] if len(parts) > 2 else ""
-                            
-                            if ':' in local_part:
-                                local_addr, local_port = local_part.rsplit(':', 1)
-                                local_port = int(local_port)
-                            else:
-                                local_addr, local_port = local_part, 0
-                            
-                            if ':' in remote_part:
-                                remote_addr, remote_port = remote_part.rsplit(':', 1)
-                                remote_port = int(remote_port)
-                            else:
-                                remote_addr, remote_port = remote_part, 0
-                            
-                            connection = NetworkConnection(
-                                protocol=parts[0] if len(parts) > 0 else "unknown",
-                                local_addr=local_addr,
-                                local_port=local_port,
-                                remote_addr=remote_addr,
-                                remote_port=remote_port,
-                                state=parts[3] if len(parts) > 3 else "unknown"
-                            )
-                            connections.append(connection)
-                        except (ValueError, IndexError):
-                            continue
-            
-            logger.info(f"Found {len(connections)} network connections")
-            return connections
-            
-        except Exception as e:
-            logger.error(f"Network analysis failed: {e}")
+            logger.error("Network analysis failed: %s", e)
             return []
     
+    async def _read_network_rows(self, analysis: ForensicAnalysis, plugin: str) -> List[NetworkConnection]:
+        """Parse a plugin's connection rows as it prints them"""
+        # Parse network output - this will need adjustment based on actual format.
+        # Rows that don't fit the pattern simply don't match, so no per-row exception handling.
+        # Protocol and state repeat on nearly every row, so they're interned
+        return [
+            NetworkConnection.model_construct(
+                protocol=intern(match.group('protocol').lower()),
+                local_addr=match.group('local_addr'),
+                local_port=int(match.group('local_port') or 0),
+                remote_addr=match.group('remote_addr'),
+                remote_port=int(match.group('remote_port') or 0),
+                state=intern(match.group('state') or "unknown"),
+                pid=int(match.group('pid') or 0)
+            )
+            async for line in self._iter_volatility_lines(analysis, plugin)
+            if (match := _NETWORK_ROW_RE.match(line))
+        ]
+    
     async def _analyze_files(self, analysis: ForensicAnalysis) -> List[OpenFile]:
         """Analyze open files"""
         try:
-            output = await self._run_volatility_command(analysis, "linux.lsof.Lsof")
-            files = []
-            
-            # Parse lsof output
-            lines = output.split('\n')
-            for line in lines:
-                if line.strip() and not line.startswith('PID') and not line.startswith('Volatility'):
-                    parts = line.strip().split()
-                    if len(parts) >= 4:
-                        try:
-                            file_info = OpenFile(
-                                pid=int(parts[0]),
-                                process=parts[1] if len(parts) > 1 else "unknown",
-                                fd=parts[2] if len(parts) > 2 else "unknown",
-                                file_type=parts[3] if len(parts) > 3 else "unknown",
-                                path=parts[4] if len(parts) > 4 else "unknown"
-                            )
-                            files.append(file_info)
-                        except (ValueError, IndexError):
-                            continue
+            # Parse lsof output as the plugin prints it; headers and malformed rows don't match.
+            # Process names, descriptors and types repeat across rows, so they're interned
+            files = [
+                OpenFile.model_construct(
+                    pid=int(match.group('pid')),
+                    process=intern(match.group('process')),
+                    fd=intern(match.group('fd')),
+                    file_type=intern(match.group('file_type')),
+                    path=match.group('path') or "unknown"
+                )
+                async for line in self._iter_volatility_lines(analysis, "linux.lsof.Lsof")
+                if (match := _LSOF_ROW_RE.match(line))
+            ]
             
-            logger.info(f"Found {len(files)} open files")
+            logger.info("Found %s open files", len(files))
             return files
             
         except Exception as e:
-            logger.error(f"File analysis failed: {e}")
+            logger.error("File analysis failed: %s", e)
             return []
     
     async def _analyze_modules(self, analysis: ForensicAnalysis) -> List[KernelModule]:
         """Analyze kernel modules"""
         try:
-            output = await self._run_volatility_command(analysis, "linux.lsmod.Lsmod")
-            modules = []
-            
-            # Parse lsmod output
-            lines = output.split('\n')
-            for line in lines:
-                if line.strip() and not line.startswith('Offset') and not line.startswith('Volatility'):
-                    parts = line.strip().split()
-                    if len(parts) >= 3:
-                        try:
-                            module = KernelModule(
-                                name=parts[1] if len(parts) > 1 else "unknown",
-                                size=int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0,
-                                instances=1,
-                                offset=parts[0] if len(parts) > 0 else None
-                            )
-                            modules.append(module)
-                        except (ValueError, IndexError):
-                            continue
+            # Parse lsmod output as the plugin prints it; headers and malformed rows don't match
+            modules = [
+                KernelModule.model_construct(
+                    name=match.group('name'),
+                    size=int(match.group('size') or 0),
+                    instances=1,
+                    offset=match.group('offset')
+                )
+                async for line in self._iter_volatility_lines(analysis, "linux.lsmod.Lsmod")
+                if (match := _LSMOD_ROW_RE.match(line))
+            ]
             
-            logger.info(f"Found {len(modules)} kernel modules")
+            logger.info("Found %s kernel modules", len(modules))
             return modules
             
         except Exception as e:
-            logger.error(f"Module analysis failed: {e}")
+            logger.error("Module analysis failed: %s", e)
             return []
     
     async def _analyze_system_info(self, analysis: ForensicAnalysis) -> Optional[SystemInfo]:
         """Analyze system information"""
         try:
-            output = await self._run_volatility_command(analysis, "banners")
-            
-            # Extract kernel version from banners
-            lines = output.split('\n')
+            # Extract kernel version from banners; stops the plugin at the first match
             kernel_version = "Unknown"
             
-            for line in lines:
-                if 'Linux version' in line:
-                    # Extract kernel version
-                    match = re.search(r'Linux version ([^\s]+)', line)
-                    if match:
-                        kernel_version = match.group(1)
-                    break
+            async with aclosing(self._iter_volatility_lines(analysis, "banners")) as lines:
+                async for line in lines:
+                    if 'Linux version' in line:
+                        # Extract kernel version
+                        match = _LINUX_VERSION_RE.search(line)
+                        if match:
+                            kernel_version = match.group(1)
+                        break
             
             system_info = SystemInfo(
                 kernel_version=kernel_version,
                 architecture="x86_64"  # Default assumption
             )
             
-            logger.info(f"System info: {kernel_version}")
+            logger.info("System info: %s", kernel_version)
             return system_info
             
         except Exception as e:
-            logger.error(f"System info analysis failed: {e}")
+            logger.error("System info analysis failed: %s", e)
             return None
     
     async def _analyze_bash_history(self, analysis: ForensicAnalysis) -> List[str]:
         """Analyze bash history"""
         try:
-            output = await self._run_volatility_command(analysis, "linux.bash")
             history = []
             
-            # Parse bash history
-            lines = output.split('\n')
-            for line in lines:
-                if line.strip() and not line.startswith('PID') and not line.startswith('Volatility'):
-                    # Extract command from bash output
-                    if '|' in line:
-                        parts = line.split('|')
-                        if len(parts) > 1:
-                            command = parts[-1].strip()
-                            if command:
-                                history.append(command)
-            
-            logger.info(f"Found {len(history)} bash history entries")
+            # Parse bash history as the plugin prints it
+            async for line in self._iter_volatility_lines(analysis, "linux.bash"):
+                # Blank lines have no separator, so they fall out without a separate check
+                if line.startswith(('PID', 'Volatility')):
+                    continue
+                
+                # Extract command from bash output: the last column, so only the final separator matters
+                _, sep, command = line.rpartition('|')
+                command = command.strip()
+                if sep and command:
+                    history.append(command)
+            
+            logger.info("Found %s bash history entries", len(history))
             return history
             
         except Exception as e:
-            logger.error(f"Bash history analysis failed: {e}")
+            logger.error("Bash history analysis failed: %s", e)
             return []
     
     def get_analysis(self, analysis_id: str) -> Optional[ForensicAnalysis]:
         """Get analysis by ID"""
+        if analysis_id in self._tombstones:
+            return None
         return self.analyses_db.get(analysis_id)
     
+    def get_analysis_progress(self, analysis_id: str) -> Optional[Dict[str, Any]]:
+        """Get an analysis' status and progress without loading its record"""
+        if analysis_id in self._tombstones or analysis_id not in self._progress:
+            return None
+        status, progress, current_step, error_message = self._progress[analysis_id]
+        return {
+            "analysis_id": analysis_id,
+            "status": status,
+            "progress": progress,
+            "current_step": current_step,
+            "error_message": error_message
+        }
+    
     def get_analyses_for_dump(self, dump_id: str) -> List[ForensicAnalysis]:
         """Get all analyses for a specific dump"""
-        return [a for a in self.analyses_db.values() if a.dump_id == dump_id]
+        return [a for a in self.get_all_analyses() if a.dump_id == dump_id]
     
     def get_all_analyses(self) -> List[ForensicAnalysis]:
         """Get all analyses"""
-        return list(self.analyses_db.values())
+        if not self._tombstones:
+            return list(self.analyses_db.values())
+        return [a for analysis_id, a in self.analyses_db.items() if analysis_id not in self._tombstones]
+    
+    def delete_analysis(self, analysis_id: str) -> bool:
+        """Tombstone an analysis and cancel it if still running"""
+        if not self.get_analysis(analysis_id):
+            return False
+        self._tombstones.add(analysis_id)
+        
+        task = self.active_analyses.pop(analysis_id, None)
+        if task:
+            task.cancel()
+        return True
+    
+    def compact(self):
+        """Drop tombstoned records from analyses_db"""
+        if not self._tombstones:
+            return
+        tombstones = self._tombstones
+        self.analyses_db = {
+            analysis_id: a for analysis_id, a in self.analyses_db.items() if analysis_id not in tombstones
+        }
+        for analysis_id in tombstones:
+            self._progress.pop(analysis_id, None)
+        self._tombstones = set()
+        logger.debug("Compacted analyses_db, dropped %s deleted analyses", len(tombstones))
 
 
 # Global service instance
@@ -0,0 +1,75 @@
+"""
+Synchronous parsers for the custom forensic analysis artifacts
+
+Kept free of asyncio and instance state, with fully typed signatures, so the
+module can be compiled ahead of time (e.g. with mypyc) without changes.
+CustomForensicAnalyzer runs these in worker threads.
+"""
+
+import itertools
+import re
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+# Interesting-string matchers for quick_strings.txt, compiled once
+_SYSCALL_RE = re.compile(rb'open|read|write|connect|bind', re.IGNORECASE)
+_URL_RE = re.compile(rb'(?:https?|ftp)://', re.IGNORECASE)
+SAMPLE_STRINGS_LIMIT = 10
+
+
+def read_json(path: str) -> Optional[Any]:
+    """Decode a JSON file, or None if it doesn't exist"""
+    try:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def read_head_lines(path: str, limit: int) -> Optional[List[str]]:
+    """Return the first stripped lines of a file, or None if it doesn't exist"""
+    try:
+        with open(path, 'r') as f:
+            return [line.strip() for line in itertools.islice(f, limit)]
+    except FileNotFoundError:
+        return None
+
+
+def read_text(path: str) -> Optional[str]:
+    """Return a file's stripped contents, or None if it doesn't exist"""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def sample_interesting_strings(path: str) -> Optional[Dict[str, List[str]]]:
+    """Collect the first few system calls, file paths and URLs in a single streaming pass"""
+    system_calls: List[str] = []
+    file_paths: List[str] = []
+    urls: List[str] = []
+
+    # Binary mode avoids decoding lines that don't match; the file can be hundreds of MB
+    try:
+        with open(path, 'rb') as f:
+            for raw_line in f:
+                line = raw_line.strip()
+                if len(system_calls) < SAMPLE_STRINGS_LIMIT and _SYSCALL_RE.search(line):
+                    system_calls.append(line.decode(errors='replace'))
+                if len(file_paths) < SAMPLE_STRINGS_LIMIT and line.startswith(b'/') and len(line) > 5:
+                    file_paths.append(line.decode(errors='replace'))
+                if len(urls) < SAMPLE_STRINGS_LIMIT and _URL_RE.search(line):
+                    urls.append(line.decode(errors='replace'))
+
+                if len(system_calls) == len(file_paths) == len(urls) == SAMPLE_STRINGS_LIMIT:
+                    break
+    except FileNotFoundError:
+        return None
+
+    return {
+        "system_calls": system_calls,
+        "file_paths": file_paths,
+        "urls": urls
+    }
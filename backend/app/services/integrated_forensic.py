@@ -11,7 +11,7 @@ import os
 import subprocess
 import re
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -45,6 +45,9 @@ class ForensicResults:
     summary: Dict[str, Any]
 
 
+_TIMESTAMP_FIELDS = ("created_at", "started_at", "completed_at")
+
+
 @dataclass
 class IntegratedAnalysis:
     """Integrated forensic analysis record"""
@@ -63,6 +66,12 @@ class IntegratedAnalysis:
     report_path: Optional[str] = None
     error_message: Optional[str] = None
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Keep an ISO string alongside each timestamp so status polling doesn't reformat it
+        if name in _TIMESTAMP_FIELDS:
+            super().__setattr__(f"{name}_iso", value.isoformat() if value else None)
+
 
 class IntegratedForensicService:
     """Service for complete forensic analysis pipeline"""
@@ -70,6 +79,7 @@ class IntegratedForensicService:
     def __init__(self):
         self.analyses_db: Dict[str, IntegratedAnalysis] = {}
         self.active_analyses: Dict[str, asyncio.Task] = {}
+        self._tombstones: Set[str] = set()  # Deleted analysis IDs, dropped by compact()
         self.base_directory = Path("/home/stack/forensic")
         # Use plugin directory directly instead of symlink
         self.scripts_directory = Path("/opt/stack/devstack-monitor-analysis")
@@ -319,7 +329,7 @@ class IntegratedForensicService:
             try:
                 # Method 2: Look for JSON-like patterns in the output
                 # Find lines that look like JSON (start with { and end with })
-                lines = output.split('\n')
+                lines = output.splitlines()
                 json_lines = []
                 in_json = False
                 brace_count = 0
@@ -362,7 +372,7 @@ class IntegratedForensicService:
                 "tools_executed": []
             }
             
-            lines = output.split('\n')
+            lines = output.splitlines()
             current_tool = None
             current_section = None
             
@@ -895,11 +905,37 @@ class IntegratedForensicService:
 
     def get_analysis(self, analysis_id: str) -> Optional[IntegratedAnalysis]:
         """Get analysis by ID"""
+        if analysis_id in self._tombstones:
+            return None
         return self.analyses_db.get(analysis_id)
 
     def get_all_analyses(self) -> List[IntegratedAnalysis]:
         """Get all analyses"""
-        return list(self.analyses_db.values())
+        if not self._tombstones:
+            return list(self.analyses_db.values())
+        return [a for analysis_id, a in self.analyses_db.items() if analysis_id not in self._tombstones]
+
+    def delete_analysis(self, analysis_id: str) -> bool:
+        """Tombstone an analysis and stop it if still running"""
+        if not self.get_analysis(analysis_id):
+            return False
+        self._tombstones.add(analysis_id)
+
+        task = self.active_analyses.pop(analysis_id, None)
+        if task:
+            task.cancel()
+        return True
+
+    def compact(self):
+        """Drop tombstoned records from analyses_db"""
+        if not self._tombstones:
+            return
+        tombstones = self._tombstones
+        self.analyses_db = {
+            analysis_id: a for analysis_id, a in self.analyses_db.items() if analysis_id not in tombstones
+        }
+        self._tombstones = set()
+        logger.debug(f"Compacted analyses_db, dropped {len(tombstones)} deleted analyses")
 
     def get_analysis_status(self, analysis_id: str) -> Optional[Dict[str, Any]]:
         """Get analysis status and progress"""
@@ -912,9 +948,9 @@ class IntegratedForensicService:
             "status": analysis.status.value,
             "progress": analysis.progress,
             "current_step": analysis.current_step,
-            "created_at": analysis.created_at.isoformat(),
-            "started_at": analysis.started_at.isoformat() if analysis.started_at else None,
-            "completed_at": analysis.completed_at.isoformat() if analysis.completed_at else None,
+            "created_at": analysis.created_at_iso,
+            "started_at": analysis.started_at_iso,
+            "completed_at": analysis.completed_at_iso,
             "error_message": analysis.error_message
         }
 
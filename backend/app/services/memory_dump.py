@@ -7,23 +7,40 @@ import asyncio
 import asyncssh
 import hashlib
 import os
+import re
 import uuid
 import logging
 import subprocess
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from pathlib import Path
 
 from ..models.dump import MemoryDump, DumpStatus, DumpType, DumpRequest
 from ..core.ssh_config import ssh_config
-from ..core.config import Settings
+from ..core.config import get_settings
+from ..core.cache import invalidate_cache
 
 # Get settings instance
-settings = Settings()
+settings = get_settings()
 
 # Create logger for this module
 logger = logging.getLogger(__name__)
 
+# libvirt domain name in a QEMU command line ("-name guest=DOMAIN,...")
+_QEMU_GUEST_NAME_RE = re.compile(r'-name guest=([^,]+)')
+
+
+def compute_checksum(path: str) -> str:
+    """SHA256 of a file, hashed by OpenSSL (SHA-NI where available) without a Python read loop"""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # Python < 3.11
+        sha256_hash = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256_hash.update(chunk)
+        return sha256_hash.hexdigest()
+
 
 class MemoryDumpService:
     """Service for managing memory dumps via SSH"""
@@ -45,6 +62,15 @@ class MemoryDumpService:
         self.dumps_db: Dict[str, MemoryDump] = {}  # In-memory storage for now
         self.active_dumps: Dict[str, asyncio.Task] = {}
         
+        # Deleted dump IDs, dropped from dumps_db by compact()
+        self._tombstones: Set[str] = set()
+        
+        # file path -> ((mtime_ns, size), sha256) so an unchanged dump is never rehashed
+        self._checksums: Dict[str, tuple] = {}
+        
+        # Aggregates maintained on every write so stats reads are O(1)
+        self._stats: Dict[str, int] = {"total": 0, "completed": 0, "failed": 0, "in_progress": 0, "total_size": 0}
+        
         # Create local dump directory if it doesn't exist
         self.dump_directory.mkdir(parents=True, exist_ok=True)
         
@@ -107,6 +133,8 @@ class MemoryDumpService:
         )
         
         self.dumps_db[dump_id] = dump
+        self._stats["total"] += 1
+        await invalidate_cache("dumps")
         
         # Start dump process asynchronously with SSH settings
         task = asyncio.create_task(self._perform_dump(dump_id, ssh_settings))
@@ -121,7 +149,8 @@ class MemoryDumpService:
         
         try:
             # Update status to in progress
-            dump.status = DumpStatus.IN_PROGRESS
+            self._set_status(dump, DumpStatus.IN_PROGRESS)
+            await invalidate_cache("dumps")
             logger.info(f"Starting memory dump {dump_id} for instance {dump.instance_id} at {dump.ssh_host}")
             
             # Execute dump based on mode
@@ -130,25 +159,57 @@ class MemoryDumpService:
             else:
                 await self._execute_remote_dump(dump, ssh_settings)
             
-            # Calculate file size and checksum
-            if os.path.exists(dump.file_path):
-                dump.file_size = os.path.getsize(dump.file_path)
-                dump.checksum = await self._calculate_checksum(dump.file_path)
-                dump.status = DumpStatus.COMPLETED
-                dump.completed_at = datetime.now()
-                logger.info(f"Memory dump {dump_id} completed successfully")
-            else:
+            # Calculate file size and checksum (a single stat also checks the file exists)
+            try:
+                file_stat = await asyncio.to_thread(os.stat, dump.file_path)
+            except FileNotFoundError:
                 raise Exception("Dump file was not created")
+            
+            self._set_file_size(dump, file_stat.st_size)
+            dump.checksum = await self._calculate_checksum(dump.file_path, file_stat)
+            self._set_status(dump, DumpStatus.COMPLETED)
+            dump.completed_at = datetime.now()
+            logger.info(f"Memory dump {dump_id} completed successfully")
                 
         except Exception as e:
-            dump.status = DumpStatus.FAILED
+            self._set_status(dump, DumpStatus.FAILED)
             dump.error_message = str(e)
             logger.error(f"Memory dump {dump_id} failed: {e}")
         finally:
+            await invalidate_cache("dumps")
             # Remove from active dumps
             if dump_id in self.active_dumps:
                 del self.active_dumps[dump_id]
     
+    _STATUS_COUNTERS = {
+        DumpStatus.COMPLETED: "completed",
+        DumpStatus.FAILED: "failed",
+        DumpStatus.IN_PROGRESS: "in_progress",
+    }
+    
+    def _counts_toward_stats(self, dump: MemoryDump) -> bool:
+        """Whether a dump is still a live record included in the materialized stats"""
+        return dump.id in self.dumps_db and dump.id not in self._tombstones
+    
+    def _set_status(self, dump: MemoryDump, status: DumpStatus):
+        """Change dump status and keep the status counters in sync"""
+        if not self._counts_toward_stats(dump):
+            dump.status = status
+            return
+        old_counter = self._STATUS_COUNTERS.get(dump.status)
+        if old_counter:
+            self._stats[old_counter] -= 1
+        dump.status = status
+        new_counter = self._STATUS_COUNTERS.get(status)
+        if new_counter:
+            self._stats[new_counter] += 1
+    
+    def _set_file_size(self, dump: MemoryDump, file_size: Optional[int]):
+        """Change dump file size and keep the total size in sync"""
+        if self._counts_toward_stats(dump):
+            self._stats["total_size"] += (file_size or 0) - (dump.file_size or 0)
+        dump.file_size = file_size
+    
     async def _execute_local_dump(self, dump: MemoryDump):
         """Execute memory dump locally using virsh only (when running on OpenStack server)"""
         logger.info(f"Executing local memory dump {dump.id} for instance {dump.instance_id}")
@@ -198,10 +259,11 @@ class MemoryDumpService:
             await asyncio.sleep(0.5)
             
             # Verify dump file was created and has reasonable size
-            if not os.path.exists(local_dump_file):
+            try:
+                file_size = os.stat(local_dump_file).st_size
+            except FileNotFoundError:
                 raise Exception("Dump file was not created")
-                
-            file_size = os.path.getsize(local_dump_file)
+            
             if file_size < 1000000:  # Less than 1MB
                 logger.warning(f"Dump file seems small: {file_size} bytes")
             else:
@@ -251,9 +313,10 @@ class MemoryDumpService:
                     logger.info(f"Found match for pattern '{pattern}': {stdout_text}")
                     
                     # Extract domain name from virsh list output
-                    lines = stdout_text.split('\n')
+                    lines = stdout_text.splitlines()
                     for line in lines:
-                        parts = line.split()
+                        # Id and Name are all we need; State may itself contain spaces
+                        parts = line.split(None, 2)
                         if len(parts) >= 2 and pattern in parts[1]:
                             logger.info(f"Extracted domain name: {parts[1]}")
                             return parts[1]
@@ -280,9 +343,9 @@ class MemoryDumpService:
                 stdout_text = stdout.decode('utf-8', errors='replace').strip()
                 logger.info(f"All domains output:\n{stdout_text}")
                 
-                lines = stdout_text.split('\n')
+                lines = stdout_text.splitlines()
                 for line in lines[2:]:  # Skip header lines
-                    parts = line.split()
+                    parts = line.split(None, 2)
                     if len(parts) >= 2:
                         domain_name = parts[1]
                         logger.debug(f"Checking domain: {domain_name} against instance: {instance_id}")
@@ -322,8 +385,7 @@ class MemoryDumpService:
                 
                 # Extract domain name from QEMU command line
                 # Look for -name guest=DOMAIN_NAME
-                import re
-                match = re.search(r'-name guest=([^,]+)', qemu_output)
+                match = _QEMU_GUEST_NAME_RE.search(qemu_output)
                 if match:
                     domain_name = match.group(1)
                     logger.info(f"Extracted domain name from QEMU: {domain_name}")
@@ -548,13 +610,16 @@ class MemoryDumpService:
             # DO NOT clean up remote file - keep for forensics and "Dumped Ram" tab
             logger.info(f"Memory dump {dump.id} completed. Remote file preserved at: {dump_file_remote}")
     
-    async def _calculate_checksum(self, file_path: str) -> str:
-        """Calculate SHA256 checksum of the dump file"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+    async def _calculate_checksum(self, file_path: str, file_stat: os.stat_result) -> str:
+        """Calculate SHA256 checksum of the dump file, reusing it while the file is unchanged"""
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self._checksums.get(file_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        checksum = await asyncio.to_thread(compute_checksum, file_path)
+        self._checksums[file_path] = (signature, checksum)
+        return checksum
     
     def _detect_os_type(self, instance_data: Dict[str, Any]) -> str:
         """Detect OS type from instance data"""
@@ -592,10 +657,69 @@ class MemoryDumpService:
     
     def get_all_dumps(self) -> List[MemoryDump]:
         """Get all memory dumps"""
-        return list(self.dumps_db.values())
+        if not self._tombstones:
+            return list(self.dumps_db.values())
+        return [dump for dump_id, dump in self.dumps_db.items() if dump_id not in self._tombstones]
+    
+    def remove_dump(self, dump_id: str) -> Optional[MemoryDump]:
+        """Tombstone a dump record, cancel it if still running and update the materialized stats"""
+        dump = self.get_dump(dump_id)
+        if dump:
+            self._tombstones.add(dump_id)
+            task = self.active_dumps.pop(dump_id, None)
+            if task:
+                task.cancel()
+            counter = self._STATUS_COUNTERS.get(dump.status)
+            if counter:
+                self._stats[counter] -= 1
+            self._stats["total_size"] -= dump.file_size or 0
+            self._stats["total"] -= 1
+        return dump
+    
+    def compact(self):
+        """Drop tombstoned records from dumps_db"""
+        if not self._tombstones:
+            return
+        tombstones = self._tombstones
+        for dump_id in tombstones:
+            if dump_id in self.dumps_db:
+                self._checksums.pop(self.dumps_db[dump_id].file_path, None)
+        self.dumps_db = {dump_id: dump for dump_id, dump in self.dumps_db.items() if dump_id not in tombstones}
+        self._tombstones = set()
+        logger.debug(f"Compacted dumps_db, dropped {len(tombstones)} deleted dumps")
+    
+    def _rebuild_stats(self):
+        """Recompute the materialized stats from scratch"""
+        stats = {"total": 0, "completed": 0, "failed": 0, "in_progress": 0, "total_size": 0}
+        for dump in self.get_all_dumps():
+            stats["total"] += 1
+            counter = self._STATUS_COUNTERS.get(dump.status)
+            if counter:
+                stats[counter] += 1
+            if dump.file_size:
+                stats["total_size"] += dump.file_size
+        self._stats = stats
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dump statistics from the counters maintained on write"""
+        # Counters drift if dumps_db is mutated directly; detect and rebuild
+        if self._stats["total"] != len(self.dumps_db) - len(self._tombstones) or min(self._stats.values()) < 0:
+            logger.warning("Dump stats out of sync with dump records, rebuilding")
+            self._rebuild_stats()
+        
+        return {
+            "total_dumps": self._stats["total"],
+            "completed_dumps": self._stats["completed"],
+            "failed_dumps": self._stats["failed"],
+            "in_progress_dumps": self._stats["in_progress"],
+            "total_size_bytes": self._stats["total_size"],
+            "total_size_gb": round(self._stats["total_size"] / (1024**3), 2)
+        }
     
     def get_dump(self, dump_id: str) -> Optional[MemoryDump]:
         """Get specific memory dump"""
+        if dump_id in self._tombstones:
+            return None
         return self.dumps_db.get(dump_id)
     
     def get_dump_file_path(self, dump_id: str) -> Optional[str]:
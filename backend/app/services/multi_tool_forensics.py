@@ -6,6 +6,7 @@ Integrates multiple forensic tools for comprehensive memory analysis
 import asyncio
 import json
 import os
+import re
 import subprocess
 import logging
 from typing import Dict, List, Optional, Any
@@ -15,6 +16,9 @@ import shutil
 
 logger = logging.getLogger(__name__)
 
+# Dotted-quad IPv4 address inside a strings line, compiled once
+_IP_ADDRESS_RE = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b')
+
 class MultiToolForensicAnalyzer:
     """
     Multi-tool forensic analyzer that combines multiple memory analysis tools
@@ -318,7 +322,7 @@ rule Suspicious_Strings {
                 
             # Parse matches
             matches = []
-            for line in matches_content.split('\n'):
+            for line in matches_content.splitlines():
                 if line.strip():
                     matches.append(line.strip())
                     
@@ -352,7 +356,7 @@ rule Suspicious_Strings {
                 f.write(strings_content)
                 
             # Analyze patterns
-            strings_lines = strings_content.split('\n')
+            strings_lines = strings_content.splitlines()
             
             # Extract specific patterns
             ip_addresses = []
@@ -362,9 +366,7 @@ rule Suspicious_Strings {
             for line in strings_lines:
                 if len(line) > 10:  # Skip very short lines
                     # IP addresses
-                    import re
-                    ip_pattern = r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
-                    if re.search(ip_pattern, line):
+                    if _IP_ADDRESS_RE.search(line):
                         ip_addresses.append(line.strip())
                         
                     # File paths
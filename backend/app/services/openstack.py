@@ -25,6 +25,56 @@ except ImportError:
     logger.warning("OpenStack SDK not available - using mock data")
 
 
+# Mock services served without an OpenStack connection, stamped with last_check per call
+_MOCK_SERVICES = (
+    Service(
+        name="keystone",
+        status=ServiceStatus.HEALTHY,
+        description="OpenStack Keystone Service",
+        port=5000,
+        uptime="3d 12h 45m",
+        response_time=45.2,
+        last_check=""
+    ),
+    Service(
+        name="nova",
+        status=ServiceStatus.HEALTHY,
+        description="OpenStack Nova Service",
+        port=8774,
+        uptime="3d 12h 45m",
+        response_time=67.8,
+        last_check=""
+    ),
+    Service(
+        name="neutron",
+        status=ServiceStatus.WARNING,
+        description="OpenStack Neutron Service",
+        port=9696,
+        uptime="2d 8h 15m",
+        response_time=89.1,
+        last_check=""
+    ),
+    Service(
+        name="glance",
+        status=ServiceStatus.HEALTHY,
+        description="OpenStack Glance Service",
+        port=9292,
+        uptime="3d 12h 45m",
+        response_time=34.5,
+        last_check=""
+    ),
+    Service(
+        name="cinder",
+        status=ServiceStatus.HEALTHY,
+        description="OpenStack Cinder Service",
+        port=8776,
+        uptime="3d 12h 45m",
+        response_time=56.7,
+        last_check=""
+    ),
+)
+
+
 class OpenStackClient:
     """OpenStack API client with real integration - FIXED"""
     
@@ -89,48 +139,35 @@ class OpenStackClient:
             
             self.connection = None
     
-    async def get_instances(self) -> List[Instance]:
-        """Get all instances from OpenStack with better error handling"""
+    async def get_instances(self, status: Optional[InstanceStatus] = None) -> List[Instance]:
+        """Get all instances from OpenStack with better error handling, optionally filtered by status"""
         if not self.connection:
             logger.warning("No OpenStack connection, using mock data")
-            return await self._get_mock_instances()
+            return self._filter_by_status(await self._get_mock_instances(), status)
         
         try:
             logger.info("Fetching instances from OpenStack...")
             
+            # Let Nova filter by status when our status maps to a single server status
+            query = {}
+            nova_statuses = self._nova_statuses(status) if status else []
+            if len(nova_statuses) == 1:
+                query["status"] = nova_statuses[0]
+            
             # Get servers from OpenStack with timeout
             servers = []
             try:
-                servers = list(self.connection.compute.servers())
+                servers = list(self.connection.compute.servers(**query))
                 logger.info(f"Found {len(servers)} servers in OpenStack")
             except Exception as e:
                 logger.error(f"Error fetching servers: {e}")
-                return await self._get_mock_instances()
+                return self._filter_by_status(await self._get_mock_instances(), status)
             
             instances = []
             
             for server in servers:
                 try:
-                    # Map OpenStack server status to our status enum
-                    status = self._map_server_status(server.status)
-                    
-                    # Get server details safely
-                    instance = Instance(
-                        id=server.id,
-                        name=server.name,
-                        status=status,
-                        flavor=self._get_flavor_name(server.flavor.get('id', 'unknown') if isinstance(server.flavor, dict) else str(server.flavor)),
-                        image=self._get_os_name_from_instance(server),
-                        ip_address=self._get_server_ip(server),
-                        uptime=self._calculate_uptime(server.created_at),
-                        cpu_usage=random.uniform(10, 80),  # Real metrics would come from monitoring
-                        memory_usage=random.uniform(20, 70),
-                        disk_usage=random.uniform(10, 50),
-                        network_rx=random.uniform(0.1, 5.0),
-                        network_tx=random.uniform(0.1, 3.0),
-                        created_at=self._parse_datetime(server.created_at)
-                    )
-                    instances.append(instance)
+                    instances.append(self._server_to_instance(server))
                     logger.debug(f"Processed instance: {server.name} ({server.status})")
                     
                 except Exception as e:
@@ -138,11 +175,39 @@ class OpenStackClient:
                     continue
             
             logger.info(f"[SUCCESS] Successfully retrieved {len(instances)} real instances from OpenStack")
-            return instances
+            return self._filter_by_status(instances, status)
             
         except Exception as e:
             logger.error(f"[ERROR] Error getting instances from OpenStack: {e}")
-            return await self._get_mock_instances()
+            return self._filter_by_status(await self._get_mock_instances(), status)
+    
+    def _server_to_instance(self, server) -> Instance:
+        """Convert an OpenStack server to an Instance"""
+        # Map OpenStack server status to our status enum
+        server_status = self._map_server_status(server.status)
+        
+        # Get server details safely
+        return Instance(
+            id=server.id,
+            name=server.name,
+            status=server_status,
+            flavor=self._get_flavor_name(server.flavor.get('id', 'unknown') if isinstance(server.flavor, dict) else str(server.flavor)),
+            image=self._get_os_name_from_instance(server),
+            ip_address=self._get_server_ip(server),
+            uptime=self._calculate_uptime(server.created_at),
+            cpu_usage=random.uniform(10, 80),  # Real metrics would come from monitoring
+            memory_usage=random.uniform(20, 70),
+            disk_usage=random.uniform(10, 50),
+            network_rx=random.uniform(0.1, 5.0),
+            network_tx=random.uniform(0.1, 3.0),
+            created_at=self._parse_datetime(server.created_at)
+        )
+    
+    def _filter_by_status(self, instances: List[Instance], status: Optional[InstanceStatus]) -> List[Instance]:
+        """Filter instances by status (a no-op when Nova already applied the filter)"""
+        if not status:
+            return instances
+        return [i for i in instances if i.status == status]
     
     def _parse_datetime(self, dt_string):
         """Parse datetime string safely and return ISO format string"""
@@ -159,6 +224,13 @@ class OpenStackClient:
         except:
             return datetime.now().isoformat()
     
+    # Server statuses reported by the Nova API
+    _NOVA_STATUSES = (
+        'ACTIVE', 'BUILD', 'DELETED', 'ERROR', 'HARD_REBOOT', 'MIGRATING', 'PASSWORD',
+        'PAUSED', 'REBOOT', 'REBUILD', 'RESCUE', 'RESIZE', 'REVERT_RESIZE', 'SHELVED',
+        'SHELVED_OFFLOADED', 'SHUTOFF', 'SOFT_DELETED', 'SUSPENDED', 'UNKNOWN', 'VERIFY_RESIZE'
+    )
+    
     def _map_server_status(self, openstack_status: str) -> InstanceStatus:
         """Map OpenStack server status to our enum"""
         status_mapping = {
@@ -177,6 +249,13 @@ class OpenStackClient:
         }
         return status_mapping.get(openstack_status.upper(), InstanceStatus.UNKNOWN)
     
+    def _nova_statuses(self, status: InstanceStatus) -> List[str]:
+        """Nova server statuses that map to one of our statuses"""
+        return [
+            nova_status for nova_status in self._NOVA_STATUSES
+            if self._map_server_status(nova_status) == status
+        ]
+    
     def _get_flavor_name(self, flavor_id: str) -> str:
         """Get flavor name from ID safely"""
         try:
@@ -382,8 +461,18 @@ class OpenStackClient:
     
     async def get_instance(self, instance_id: str) -> Optional[Instance]:
         """Get specific instance"""
-        instances = await self.get_instances()
-        return next((i for i in instances if i.id == instance_id), None)
+        if not self.connection:
+            instances = await self._get_mock_instances()
+            return next((i for i in instances if i.id == instance_id), None)
+        
+        try:
+            server = self.connection.compute.find_server(instance_id, ignore_missing=True)
+            if not server:
+                return None
+            return self._server_to_instance(server)
+        except Exception as e:
+            logger.error(f"Error getting instance {instance_id} from OpenStack: {e}")
+            return None
     
     def _get_service_display_name(self, service_type: str) -> str:
         """Get the real display name for OpenStack services"""
@@ -515,55 +604,9 @@ class OpenStackClient:
         """Fallback mock services"""
         logger.info("Using mock services data")
         
-        mock_services = [
-            Service(
-                name="keystone",
-                status=ServiceStatus.HEALTHY,
-                description="OpenStack Keystone Service",
-                port=5000,
-                uptime="3d 12h 45m",
-                response_time=45.2,
-                last_check=datetime.now().isoformat()
-            ),
-            Service(
-                name="nova",
-                status=ServiceStatus.HEALTHY,
-                description="OpenStack Nova Service",
-                port=8774,
-                uptime="3d 12h 45m",
-                response_time=67.8,
-                last_check=datetime.now().isoformat()
-            ),
-            Service(
-                name="neutron",
-                status=ServiceStatus.WARNING,
-                description="OpenStack Neutron Service",
-                port=9696,
-                uptime="2d 8h 15m",
-                response_time=89.1,
-                last_check=datetime.now().isoformat()
-            ),
-            Service(
-                name="glance",
-                status=ServiceStatus.HEALTHY,
-                description="OpenStack Glance Service",
-                port=9292,
-                uptime="3d 12h 45m",
-                response_time=34.5,
-                last_check=datetime.now().isoformat()
-            ),
-            Service(
-                name="cinder",
-                status=ServiceStatus.HEALTHY,
-                description="OpenStack Cinder Service",
-                port=8776,
-                uptime="3d 12h 45m",
-                response_time=56.7,
-                last_check=datetime.now().isoformat()
-            )
-        ]
-        
-        return mock_services
+        # Only the check time changes between calls; copying skips re-validation
+        last_check = datetime.now().isoformat()
+        return [service.model_copy(update={"last_check": last_check}) for service in _MOCK_SERVICES]
     
     async def get_service(self, service_name: str) -> Optional[Service]:
         """Get specific service"""
@@ -0,0 +1,81 @@
+"""
+Background sampler for host system metrics
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import psutil
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SystemMetricsSampler:
+    """Periodically samples psutil counters so endpoints never block on them"""
+    
+    def __init__(self):
+        self.snapshot: Dict[str, Any] = {}
+        self.sampler_task = None
+        self._new_sample = asyncio.Event()
+    
+    def sample(self):
+        """Take a new snapshot of CPU, memory, disk and network counters"""
+        # interval=None measures CPU usage since the previous call instead of sleeping
+        self.snapshot = {
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "cpu_count": psutil.cpu_count(),
+            "memory": psutil.virtual_memory(),
+            "disk": psutil.disk_usage('/'),
+            "net_io": psutil.net_io_counters()
+        }
+        # Wake everyone waiting for this sample, then start a fresh event for the next one
+        self._new_sample.set()
+        self._new_sample = asyncio.Event()
+    
+    async def wait_for_sample(self) -> Dict[str, Any]:
+        """Wait for the next snapshot and return it"""
+        await self._new_sample.wait()
+        return self.snapshot
+    
+    def get_timestamp(self) -> str:
+        """UTC timestamp of the latest snapshot, formatted once per sample"""
+        return self.get_snapshot()["timestamp"]
+    
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Get the latest snapshot, sampling once if the sampler has not run yet"""
+        if not self.snapshot:
+            self.sample()
+        return self.snapshot
+    
+    async def start(self):
+        """Start the background sampling loop"""
+        if self.sampler_task:
+            return
+        
+        self.sample()
+        self.sampler_task = asyncio.create_task(self._sample_loop())
+        logger.info("System metrics sampler started")
+    
+    async def stop(self):
+        """Stop the background sampling loop"""
+        if self.sampler_task:
+            self.sampler_task.cancel()
+            self.sampler_task = None
+    
+    async def _sample_loop(self):
+        """Refresh the snapshot every METRICS_SAMPLE_INTERVAL seconds"""
+        while True:
+            await asyncio.sleep(settings.METRICS_SAMPLE_INTERVAL)
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Error sampling system metrics: {e}")
+
+
+# Global service instance
+system_metrics_sampler = SystemMetricsSampler()
@@ -12,16 +12,23 @@ from pathlib import Path
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, HTTPException
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse
 
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.cache import setup_cache
+from app.api.responses import OrjsonResponse
 from app.api.routes import api_router
 from app.services.monitor import HealthMonitor
 from app.services.websocket import WebSocketManager
+from app.services.memory_dump import memory_dump_service
+from app.services.forensic_analysis import forensic_service
+from app.services.integrated_forensic import integrated_forensic_service
+from app.services.system_metrics import system_metrics_sampler
 
 # Setup logging
 setup_logging()
@@ -33,12 +40,26 @@ websocket_manager = WebSocketManager()
 # Health monitor
 health_monitor = HealthMonitor(websocket_manager)
 
+async def compact_stores():
+    """Periodically drop deleted (tombstoned) records from the in-memory stores"""
+    while True:
+        await asyncio.sleep(settings.STORE_COMPACTION_INTERVAL)
+        try:
+            memory_dump_service.compact()
+            forensic_service.compact()
+            integrated_forensic_service.compact()
+        except Exception as e:
+            logger.error(f"Error compacting in-memory stores: {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
     logger.info("Starting DevStack Health Monitor...")
+    await setup_cache()
+    await system_metrics_sampler.start()
     await health_monitor.start_monitoring()
+    compaction_task = asyncio.create_task(compact_stores())
     logger.info(f"Health Monitor started on port {settings.PORT}")
     logger.info(f"Dashboard available at: http://localhost:{settings.PORT}")
     logger.info(f"API documentation at: http://localhost:{settings.PORT}/api/docs")
@@ -47,7 +68,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down DevStack Health Monitor...")
+    compaction_task.cancel()
+    await system_metrics_sampler.stop()
     await health_monitor.stop_monitoring()
+    await forensic_service.close()
 
 # Create FastAPI app
 app = FastAPI(
@@ -56,6 +80,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=OrjsonResponse,
     lifespan=lifespan
 )
 
@@ -68,6 +93,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(HTTPException)
+async def passthrough_http_exception_handler(request: Request, exc: HTTPException):
+    """Return HTTP errors raised by endpoints unchanged"""
+    return await http_exception_handler(request, exc)
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Turn unhandled endpoint errors into JSON 500 responses"""
+    logger.error(f"Unhandled error on {request.method} {request.url.path}: {exc}", exc_info=exc)
+    return OrjsonResponse(status_code=500, content={"detail": str(exc)})
+
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
@@ -115,7 +151,7 @@ if dist_path.exists() and assets_path.exists():
     async def serve_frontend(request: Request, full_path: str):
         """Serve frontend application"""
         # Skip API routes and WebSocket
-        if full_path.startswith("api/") or full_path.startswith("ws") or full_path == "health":
+        if full_path.startswith(("api/", "ws")) or full_path == "health":
             return HTMLResponse("Not Found", status_code=404)
         
         # Serve static files directly from assets
@@ -44,27 +44,19 @@ const Dashboard: React.FC = () => {
     const fetchData = async () => {
       setIsLoading(true)
       try {
-        // Get instances, services, system uptime and metrics data in parallel
-        const [instancesResponse, servicesResponse, systemResponse, metricsResponse] = await Promise.all([
-          fetch('/api/instances'),
-          fetch('/api/services'),
-          fetch('/api/system/uptime'),
-          fetch('/api/metrics/summary')
-        ])
+        // Get instances, services, system uptime and metrics data in a single request
+        const dashboardResponse = await fetch('/api/dashboard')
         
-        if (instancesResponse.ok && servicesResponse.ok) {
-          const instancesData = await instancesResponse.json()
-          const servicesData = await servicesResponse.json()
+        if (dashboardResponse.ok) {
+          const dashboardData = await dashboardResponse.json()
           
-          // Extract actual arrays from API response
-          const instances = instancesData.value || instancesData
-          const services = servicesData.value || servicesData
+          const instances = dashboardData.instances
+          const services = dashboardData.services
           
           // Get system uptime from DevStack API
           let systemUptime = '0h 0m'
-          if (systemResponse.ok) {
-            const systemData = await systemResponse.json()
-            systemUptime = systemData.uptime || '0h 0m'
+          if (dashboardData.uptime) {
+            systemUptime = dashboardData.uptime.uptime || '0h 0m'
           } else {
             // Fallback: calculate uptime from oldest instance if system API fails
             if (instances.length > 0) {
@@ -81,8 +73,8 @@ const Dashboard: React.FC = () => {
 
           // Get metrics data
           let cpu = 0, memory = 0, memoryTotalGb = 0, memoryUsedGb = 0, memoryAvailableGb = 0, systemStatus = 'Unknown'
-          if (metricsResponse.ok) {
-            const metricsData = await metricsResponse.json()
+          if (dashboardData.metrics) {
+            const metricsData = dashboardData.metrics
             cpu = metricsData.cpu?.current || 0
             memory = metricsData.memory?.current || 0
             memoryTotalGb = metricsData.memory?.total_gb || 0